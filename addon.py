@@ -9,14 +9,17 @@ Blenderアドオン開発用の拡張可能なフレームワーク
 - クラス自動登録システム
 """
 
+import functools
+import hashlib
 import importlib
 import inspect
+import json
 import os
 import pkgutil
 import re
 import sys
-from collections import defaultdict
-from typing import Dict, List, Pattern, Set
+from collections import defaultdict, deque
+from typing import Dict, FrozenSet, List, Optional, Pattern, Set, Tuple
 
 import bpy
 
@@ -35,7 +38,7 @@ BL_VERSION = (0, 0, 0)  # 対応Blenderバージョン
 
 # アドオン基本情報
 ADDON_PATH = os.path.dirname(os.path.abspath(__file__))
-ADDON_ID = os.path.basename(ADDON_PATH)
+ADDON_ID = sys.intern(os.path.basename(ADDON_PATH))  # モジュール名との比較が多いため
 TEMP_PREFS_ID = f"addon_{ADDON_ID}"
 ADDON_PREFIX = "".join([s[0] for s in re.split(r"[_-]", ADDON_ID)]).upper()
 ADDON_PREFIX_PY = ADDON_PREFIX.lower()
@@ -49,6 +52,10 @@ ICON_ENUM_ITEMS = (
 
 # キャッシュ
 _class_cache: List[bpy.types.bpy_struct] = None
+_class_cache_key: Tuple[int, ...] = None  # キャッシュ作成時のモジュール構成
+# ソースが変わらない限り再起動後もクラスの登録順を再利用する
+# (Blenderのユーザー設定ディレクトリ内の、このファイル名で保存する)
+CLASS_CACHE_FILE_NAME = "class_order.json"
 
 # ======================================================
 # ユーティリティ関数
@@ -150,6 +157,7 @@ def init_addon(
 
     # 初期化処理
     _class_cache = None
+    _clear_class_caches()
     module = sys.modules[ADDON_ID]
     VERSION = module.bl_info.get("version", VERSION)
     BL_VERSION = module.bl_info.get("blender", BL_VERSION)
@@ -214,20 +222,25 @@ def _resolve_forced_order(force_order: List[str], module_names: List[str]) -> Li
         List[str]: 解決された順序リスト
     """
     # プレフィックスの追加（省略時の利便性向上）
+    # リストは順序保持用、セットは所属判定用
+    module_set = set(module_names)
     processed_order = []
+    processed_set = set()
     for mod in force_order:
         if not mod.startswith(ADDON_ID):
             full_name = f"{ADDON_ID}.{mod}"
         else:
             full_name = mod
 
-        if full_name in module_names:
-            processed_order.append(full_name)
+        if full_name in module_set:
+            if full_name not in processed_set:
+                processed_order.append(full_name)
+                processed_set.add(full_name)
         else:
             print(f"警告: 指定されたモジュール {full_name} は見つかりません")
 
     # 指定されていないモジュールを末尾に追加
-    remaining = [m for m in module_names if m not in processed_order]
+    remaining = [m for m in module_names if m not in processed_set]
     return processed_order + remaining
 
 
@@ -256,12 +269,14 @@ def _analyze_dependencies(module_names: List[str]) -> Dict[str, Set[str]]:
     import_graph = _analyze_imports(module_names)
 
     # コード内での明示的・暗黙的依存関係
-    graph = defaultdict(set)
+    # 辺はリストに追記し、重複除去は最後に一度だけ行う
+    graph: Dict[str, List[str]] = {mod_name: [] for mod_name in module_names}
     pdtype = bpy.props._PropertyDeferred
+    module_set = set(module_names)
 
     # インポート依存関係をマージ
     for mod_name, deps in import_graph.items():
-        graph[mod_name].update(deps)
+        graph[mod_name].extend(deps)
 
     for mod_name in module_names:
         mod = sys.modules.get(mod_name)
@@ -285,17 +300,19 @@ def _analyze_dependencies(module_names: List[str]) -> Dict[str, Set[str]]:
                         continue
 
                     # 依存関係の正しい方向: 依存先→依存元（被依存関係）
-                    if dep_mod in module_names:
+                    if dep_mod in module_set:
                         # 注: 方向は「依存先 → 依存元」
-                        graph[dep_mod].add(mod_name)
+                        graph[dep_mod].append(mod_name)
 
         # 明示的依存関係
         if hasattr(mod, "DEPENDS_ON"):
             for dep in mod.DEPENDS_ON:
                 dep_full = f"{ADDON_ID}.{dep}"
-                if dep_full in module_names:
+                if dep_full in module_set:
                     # 注: 方向は「依存先 → 依存元」
-                    graph[dep_full].add(mod_name)
+                    graph[dep_full].append(mod_name)
+
+    graph = {mod: set(deps) for mod, deps in graph.items() if deps}
 
     if DBG_INIT:
         print("\n=== 依存関係詳細 ===")
@@ -327,7 +344,8 @@ def _analyze_imports(module_names: List[str]) -> Dict[str, Set[str]]:
     """
     import ast
 
-    graph = defaultdict(set)
+    graph: Dict[str, List[str]] = {mod_name: [] for mod_name in module_names}
+    module_set = set(module_names)
 
     for mod_name in module_names:
         mod = sys.modules.get(mod_name)
@@ -354,15 +372,15 @@ def _analyze_imports(module_names: List[str]) -> Dict[str, Set[str]]:
                         imported_name = name.name
                         # アドオン内のモジュールのみ対象
                         if imported_name.startswith(ADDON_ID):
-                            graph[mod_name].add(imported_name)
+                            graph[mod_name].append(imported_name)
                         # サブモジュールのインポートも解析（例: import x.y）
                         else:
                             parts = imported_name.split(".")
                             for i in range(1, len(parts)):
                                 prefix = ".".join(parts[: i + 1])
                                 full_name = f"{ADDON_ID}.{prefix}"
-                                if full_name in module_names:
-                                    graph[mod_name].add(full_name)
+                                if full_name in module_set:
+                                    graph[mod_name].append(full_name)
 
                 # 'from x.y import z' 形式
                 elif isinstance(node, ast.ImportFrom):
@@ -384,20 +402,20 @@ def _analyze_imports(module_names: List[str]) -> Dict[str, Set[str]]:
                         if not full_import.startswith(ADDON_ID) and module_path:
                             full_import = f"{ADDON_ID}.{module_path}"
 
-                        if full_import in module_names:
-                            graph[mod_name].add(full_import)
+                        if full_import in module_set:
+                            graph[mod_name].append(full_import)
 
                         # サブモジュールも対象にする
                         for name in node.names:
                             if name.name != "*":  # ワイルドカードインポートはスキップ
                                 full_submodule = f"{full_import}.{name.name}"
-                                if full_submodule in module_names:
-                                    graph[mod_name].add(full_submodule)
+                                if full_submodule in module_set:
+                                    graph[mod_name].append(full_submodule)
 
         except Exception as e:
             print(f"インポート解析エラー ({mod_name}): {str(e)}")
 
-    return graph
+    return {mod: set(deps) for mod, deps in graph.items() if deps}
 
 
 def _sort_modules(module_names: List[str]) -> List[str]:
@@ -414,10 +432,11 @@ def _sort_modules(module_names: List[str]) -> List[str]:
     graph = _analyze_dependencies(module_names)
 
     # フィルタリング - 実際に存在するモジュールのみを対象に
+    module_set = set(module_names)
     filtered_graph = {
-        n: {d for d in deps if d in module_names}
+        n: {d for d in deps if d in module_set}
         for n, deps in graph.items()
-        if n in module_names
+        if n in module_set
     }
 
     # アドオン自体のモジュールが最初に来るようにする
@@ -466,7 +485,8 @@ def _sort_modules(module_names: List[str]) -> List[str]:
         sorted_modules = _alternative_sort(filtered_graph, module_names)
 
     # 未処理モジュールを末尾に追加
-    remaining = [m for m in module_names if m not in sorted_modules]
+    sorted_set = set(sorted_modules)
+    remaining = [m for m in module_names if m not in sorted_set]
     if remaining:
         print(f"\n未処理モジュール追加: {', '.join(remaining)}")
         sorted_modules.extend(remaining)
@@ -511,11 +531,11 @@ def _topological_sort(graph: Dict[str, List[str]]) -> List[str]:
             in_degree[neighbor] += 1
 
     # 入次数0（他から依存されていない）のノードから開始
-    queue = [node for node in graph if in_degree[node] == 0]
+    queue = deque(node for node in graph if in_degree[node] == 0)
     sorted_order = []
 
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         sorted_order.append(node)
 
         for neighbor in graph.get(node, []):
@@ -738,7 +758,7 @@ def register_modules() -> None:
     if BACKGROUND and bpy.app.background:
         return
 
-    classes = _get_classes()
+    classes = _get_classes(force=False)
     success = True
 
     # クラス登録
@@ -797,12 +817,15 @@ def unregister_modules() -> None:
             print(f"モジュール登録解除エラー: {mod_name} - {str(e)}")
 
     # クラス登録解除
-    for cls in reversed(_get_classes()):
+    for cls in reversed(_get_classes(force=False)):
         try:
             bpy.utils.unregister_class(cls)
         except Exception as e:
             print(f"クラス登録解除エラー: {cls.__name__} - {str(e)}")
 
+    # リロード後は別のクラスオブジェクトになるため、古い参照を手放す
+    _clear_class_caches()
+
 
 # ======================================================
 # ヘルパー関数
@@ -857,12 +880,23 @@ def _get_classes(force: bool = True) -> List[bpy.types.bpy_struct]:
     Returns:
         List[bpy.types.bpy_struct]: 依存関係順にソートされたクラスリスト
     """
-    global _class_cache
-    if not force and _class_cache:
+    global _class_cache, _class_cache_key
+    # モジュール構成が変わっていなければキャッシュを再利用
+    cache_key = tuple(id(sys.modules.get(mod_name)) for mod_name in MODULE_NAMES)
+    if not force and _class_cache and _class_cache_key == cache_key:
         return _class_cache
 
-    class_deps = defaultdict(set)
-    pdtype = getattr(bpy.props, "_PropertyDeferred", tuple)
+    source_hash = _get_source_hash()
+    if not force and source_hash:
+        persisted = _load_persisted_classes(source_hash)
+        if persisted:
+            if DBG_INIT:
+                print(f"クラス登録順をキャッシュから復元: {len(persisted)}件")
+            _class_cache = persisted
+            _class_cache_key = cache_key
+            return persisted
+
+    class_deps = {}
 
     # クラス収集
     all_classes = []
@@ -870,43 +904,36 @@ def _get_classes(force: bool = True) -> List[bpy.types.bpy_struct]:
         mod = sys.modules[mod_name]
         for _, cls in inspect.getmembers(mod, _is_bpy_class):
             # クラスの依存関係を収集（プロパティの型）
-            deps = set()
-            for prop in getattr(cls, "__annotations__", {}).values():
-                if isinstance(prop, pdtype):
-                    pfunc = getattr(prop, "function", None) or prop[0]
-                    if pfunc in (
-                        bpy.props.PointerProperty,
-                        bpy.props.CollectionProperty,
-                    ):
-                        if dep_cls := prop.keywords.get("type"):
-                            if dep_cls.__module__.startswith(ADDON_ID):
-                                deps.add(dep_cls)
-            class_deps[cls] = deps
+            class_deps[cls] = _get_class_dependencies(cls)
             all_classes.append(cls)
 
-    # 依存関係ソート（深さ優先探索）
+    # 依存関係ソート（Kahnのアルゴリズム）
+    # in_degree: 未処理の依存先の数 / dependents: 依存先 → 依存元 の逆引き
+    in_degree: Dict[type, int] = {}
+    dependents: Dict[type, List[type]] = defaultdict(list)
+    # 複数モジュールからインポートされたクラスは重複して収集されるため除外
+    for cls in dict.fromkeys(all_classes):
+        for dep in class_deps[cls]:
+            # 依存先を先に登録しておき、元の収集順をできるだけ保つ
+            in_degree.setdefault(dep, 0)
+            dependents[dep].append(cls)
+        in_degree[cls] = in_degree.get(cls, 0) + len(class_deps[cls])
+
+    queue = deque(c for c, d in in_degree.items() if d == 0)
     ordered = []
-    visited = set()
-    stack = []
-
-    def visit(cls):
-        """深さ優先探索による依存関係解決"""
-        if cls in stack:
-            cycle = " → ".join([c.__name__ for c in stack])
-            raise ValueError(f"クラス循環依存: {cycle}")
-        if cls not in visited:
-            stack.append(cls)
-            visited.add(cls)
-            # 依存先を先に処理
-            for dep in class_deps.get(cls, []):
-                visit(dep)
-            stack.pop()
-            ordered.append(cls)
-
-    # 全クラスを処理
-    for cls in all_classes:
-        if cls not in visited:
-            visit(cls)
+    while queue:
+        cls = queue.popleft()
+        ordered.append(cls)
+        for dependent in dependents.get(cls, ()):
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+
+    # 全クラスを処理できなかった場合は循環依存がある
+    if len(ordered) != len(in_degree):
+        cyclic = [c for c, d in in_degree.items() if d > 0]
+        path = _find_cycle_path(cyclic, class_deps)
+        raise ValueError(f"クラス循環依存: {' → '.join(c.__name__ for c in path)}")
 
     if DBG_INIT:
         print("\n=== 登録クラス一覧 ===")
@@ -914,9 +941,191 @@ def _get_classes(force: bool = True) -> List[bpy.types.bpy_struct]:
             print(f" - {cls.__name__}")
 
     _class_cache = ordered
+    _class_cache_key = cache_key
+    if source_hash:
+        _save_persisted_classes(source_hash, ordered)
     return ordered
 
 
+def _get_class_cache_file(create: bool = False) -> Optional[str]:
+    """
+    クラスの登録順を保存するファイルのパスを返す
+
+    Args:
+        create: 保存先のディレクトリが無い場合に作成するか
+
+    Returns:
+        Optional[str]: ファイルのパス。ユーザー設定ディレクトリを取得できない場合はNone
+    """
+    directory = bpy.utils.user_resource("CONFIG", path=ADDON_ID, create=create)
+    if not directory:
+        return None
+    return os.path.join(directory, CLASS_CACHE_FILE_NAME)
+
+
+def _get_source_hash() -> Optional[str]:
+    """
+    登録対象モジュールのソースファイルの状態からハッシュを求める
+
+    ファイル内容は読まず、更新日時とサイズのみを用います。
+
+    Returns:
+        Optional[str]: ハッシュ値。ファイル情報を取得できない場合はNone
+    """
+    digest = hashlib.md5()
+    try:
+        for mod_name in MODULE_NAMES:
+            digest.update(mod_name.encode())
+            path = getattr(sys.modules.get(mod_name), "__file__", None)
+            if path:
+                stat = os.stat(path)
+                digest.update(f":{stat.st_mtime_ns}:{stat.st_size};".encode())
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _load_persisted_classes(
+    source_hash: str,
+) -> Optional[List[bpy.types.bpy_struct]]:
+    """
+    ディスクに保存したクラスの登録順を読み込む
+
+    保存されているのはモジュール名と修飾名のみで、
+    クラスは読み込み済みのモジュールから解決します。
+
+    Args:
+        source_hash: 現在のソースのハッシュ
+
+    Returns:
+        Optional[List[bpy.types.bpy_struct]]: 登録順のクラスリスト。
+            キャッシュが存在しない・古い・解決できない場合はNone
+    """
+    cache_file = _get_class_cache_file()
+    if not cache_file:
+        return None
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        cached_hash, names = data["hash"], data["classes"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"クラスキャッシュ読み込みエラー: {str(e)}")
+        return None
+
+    if cached_hash != source_hash:
+        return None
+
+    classes = []
+    for mod_name, qualname in names:
+        obj = sys.modules.get(mod_name)
+        for attr in qualname.split("."):
+            obj = getattr(obj, attr, None)
+        # ソース以外の要因でクラス構成が変わった場合は通常の解析に戻す
+        if not _is_bpy_class(obj):
+            return None
+        classes.append(obj)
+    return classes
+
+
+def _save_persisted_classes(
+    source_hash: str, classes: List[bpy.types.bpy_struct]
+) -> None:
+    """
+    クラスの登録順をディスクに保存する
+
+    Args:
+        source_hash: 現在のソースのハッシュ
+        classes: 登録順のクラスリスト
+    """
+    names = [[cls.__module__, cls.__qualname__] for cls in classes]
+    try:
+        cache_file = _get_class_cache_file(create=True)
+        if not cache_file:
+            return
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"hash": source_hash, "classes": names}, f)
+    except Exception as e:
+        print(f"クラスキャッシュ保存エラー: {str(e)}")
+
+
+def _find_cycle_path(
+    nodes: List[type], deps: Dict[type, FrozenSet[type]]
+) -> List[type]:
+    """
+    3色DFSで最初に見つかった循環の経路を返す
+
+    灰色（探索中）のノードへの辺を見つけた時点で打ち切り、
+    その時点の探索経路から循環部分を切り出します。
+
+    Args:
+        nodes: 探索対象のクラス
+        deps: クラスごとの依存先
+
+    Returns:
+        List[type]: 循環の経路（始点を末尾にも含む）。循環がなければ空リスト
+    """
+    WHITE, GRAY, BLACK = 0, 1, 2
+    color = {cls: WHITE for cls in nodes}
+
+    for root in nodes:
+        if color[root] != WHITE:
+            continue
+        color[root] = GRAY
+        path = [root]
+        stack = [iter(deps.get(root, ()))]
+        while stack:
+            for dep in stack[-1]:
+                state = color.get(dep, BLACK)
+                if state == GRAY:
+                    return path[path.index(dep) :] + [dep]
+                if state == WHITE:
+                    color[dep] = GRAY
+                    path.append(dep)
+                    stack.append(iter(deps.get(dep, ())))
+                    break
+            else:
+                color[path.pop()] = BLACK
+                stack.pop()
+    return []
+
+
+@functools.lru_cache(maxsize=None)
+def _get_class_dependencies(cls: bpy.types.bpy_struct) -> FrozenSet[type]:
+    """
+    クラスが依存するアドオン内クラスを取得
+
+    PointerProperty/CollectionPropertyの型を依存先として扱います。
+    クラス単位でキャッシュされるため、再登録時の走査を省略できます。
+
+    Args:
+        cls: 解析するクラス
+
+    Returns:
+        FrozenSet[type]: 依存先クラスの集合
+    """
+    pdtype = getattr(bpy.props, "_PropertyDeferred", tuple)
+    deps = set()
+    for prop in getattr(cls, "__annotations__", {}).values():
+        if isinstance(prop, pdtype):
+            pfunc = getattr(prop, "function", None) or prop[0]
+            if pfunc in (
+                bpy.props.PointerProperty,
+                bpy.props.CollectionProperty,
+            ):
+                if dep_cls := prop.keywords.get("type"):
+                    if dep_cls.__module__.startswith(ADDON_ID):
+                        deps.add(dep_cls)
+    return frozenset(deps)
+
+
+def _clear_class_caches() -> None:
+    """クラス単位のキャッシュを破棄"""
+    _get_class_dependencies.cache_clear()
+    _is_addon_bpy_class.cache_clear()
+
+
 def _is_bpy_class(obj) -> bool:
     """
     bpy構造体クラスか判定
@@ -930,11 +1139,17 @@ def _is_bpy_class(obj) -> bool:
     Returns:
         bool: Blenderに登録可能なクラスの場合True
     """
+    # モジュール内の任意のメンバーが渡されるため、ハッシュ可能なクラスのみキャッシュ
+    return inspect.isclass(obj) and _is_addon_bpy_class(obj)
+
+
+@functools.lru_cache(maxsize=None)
+def _is_addon_bpy_class(cls: type) -> bool:
+    """_is_bpy_class のクラス判定部分（クラス単位でキャッシュ）"""
     return (
-        inspect.isclass(obj)
-        and issubclass(obj, bpy.types.bpy_struct)
-        and obj.__base__ is not bpy.types.bpy_struct
-        and obj.__module__.startswith(ADDON_ID)
+        issubclass(cls, bpy.types.bpy_struct)
+        and cls.__base__ is not bpy.types.bpy_struct
+        and cls.__module__.startswith(ADDON_ID)
     )
 
 
@@ -978,7 +1193,8 @@ class Timeout:
     idx: bpy.props.IntProperty(options={"SKIP_SAVE", "HIDDEN"})
     delay: bpy.props.FloatProperty(default=0.0001, options={"SKIP_SAVE", "HIDDEN"})
 
-    _data: Dict[int, tuple] = dict()  # タイムアウト関数のデータ保持用
+    _data: List[Optional[tuple]] = []  # タイムアウト関数のデータ保持用
+    _free: List[int] = []  # 実行済みで再利用できる _data のインデックス
     _timer = None
     _finished = False
 
@@ -987,7 +1203,8 @@ class Timeout:
         if event.type == "TIMER":
             if self._finished:
                 context.window_manager.event_timer_remove(self._timer)
-                del self._data[self.idx]
+                self._data[self.idx] = None
+                self._free.append(self.idx)
                 return {"FINISHED"}
 
             if self._timer.time_duration >= self.delay:
@@ -1025,10 +1242,12 @@ def timeout(func: callable, *args) -> None:
         func: 実行する関数
         *args: 関数に渡す引数
     """
-    idx = len(Timeout._data)
-    while idx in Timeout._data:
-        idx += 1
-    Timeout._data[idx] = (func, args)
+    if Timeout._free:
+        idx = Timeout._free.pop()
+        Timeout._data[idx] = (func, args)
+    else:
+        idx = len(Timeout._data)
+        Timeout._data.append((func, args))
     getattr(bpy.ops, ADDON_PREFIX_PY).timeout(idx=idx)
 
 
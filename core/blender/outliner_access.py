@@ -66,8 +66,6 @@ def get_selected_outliner_elements(
         log.error("アウトライナーが見つかりません")
         return []
 
-    selected_elements = []
-
     # 最上位のツリー要素（ルート）を取得
     root = _SpaceOutliner.get_tree(space)
     if not root:
@@ -75,19 +73,14 @@ def get_selected_outliner_elements(
         return []
 
     # すべてのサブツリー要素を取得して選択状態をチェック
-    for tree in subtrees_get(root):
-        # store_elemがなければスキップ
-        if not tree.store_elem:
-            continue
-
-        # 選択状態をチェック
-        tse = tree.store_elem.contents
-        if is_selected(tse.flag):
-            # 選択されている要素を辞書として保存
-            element_info = OutlinerElementInfo.create(tree, tse)
-            selected_elements.append(element_info)
-
-    return selected_elements
+    # store_elemがない要素はスキップし、選択されている要素だけを保存する
+    # ツリー全体を走査するため、appendを呼ばずに内包表記でまとめて生成する
+    return [
+        OutlinerElementInfo.create(tree, tse)
+        for tree in subtrees_get(root)
+        if (store_elem := tree.store_elem)
+        and is_selected((tse := store_elem.contents).flag)
+    ]
 
 
 # -----------------
@@ -116,12 +109,14 @@ def subtrees_get(tree) -> List[TreeElement]:
     """
     trees = []
     pool = [tree]
+    # ループ内で属性を引かないよう、メソッドを事前に束縛しておく
+    add_tree, push, pop = trees.append, pool.append, pool.pop
     while pool:
-        t = pool.pop().contents
-        trees.append(t)
+        t = pop().contents
+        add_tree(t)
         child = t.subtree.first
         while child:
-            pool.append(child)
+            push(child)
             child = child.contents.next
     # 最初の要素（ルート）を除いたサブツリーを返す
     return trees[1:] if len(trees) > 1 else []
@@ -1,4 +1,6 @@
-from abc import ABC, abstractmethod
+import re
+from abc import abstractmethod
+from typing import ClassVar, Dict, Protocol, Tuple
 
 from .element import BaseElement, ElementConfig
 from ...utils.logging import get_logger
@@ -6,8 +8,14 @@ from ...utils.logging import get_logger
 log = get_logger(__name__)
 
 
-class ICounter(ABC):
-    """Interface for all counter types"""
+class ICounter(Protocol):
+    """Interface for all counter types
+
+    実行時の isinstance 判定には使わず、カウンターかどうかは INameElement.is_counter で判定する。
+    明示的に継承したクラスでは抽象メソッドの実装漏れが生成時に検出される
+    """
+
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -47,11 +55,6 @@ class ICounter(ABC):
         """Format an integer value according to counter rules"""
         pass
 
-    @abstractmethod
-    def gen_proposed_name(self, value: int) -> str:
-        """Generate proposed name with given counter value"""
-        pass
-
     @abstractmethod
     def take_over_counter(self, other: "ICounter", force: bool = False) -> None:
         """Take over counter from another counter"""
@@ -61,6 +64,13 @@ class ICounter(ABC):
 class BaseCounter(BaseElement, ICounter):
     """Base implementation for all counters"""
 
+    __slots__ = ("_value_int", "forward", "backward")
+
+    is_counter = True
+
+    # 同じ設定のカウンター間でコンパイル済みパターンを共有する
+    _compiled_patterns: ClassVar[Dict[Tuple, re.Pattern[str]]] = {}
+
     def __init__(self, element_config: ElementConfig):
         super().__init__(element_config)
         self._value_int = None
@@ -69,6 +79,21 @@ class BaseCounter(BaseElement, ICounter):
 
     # TODO: INameElementとICounterを継承して、BaseCounterを作成する
 
+    def _pattern_key(self) -> Tuple:
+        """パターンを決定する設定値の組。サブクラス固有の設定があれば追加する"""
+        return (type(self), self.id, self.order, self.separator)
+
+    def initialize_cache(self) -> None:
+        """設定が同じカウンターのコンパイル済みパターンがあれば再利用する"""
+        if self.cache_invalidated or self._pattern is None:
+            key = self._pattern_key()
+            pattern = self._compiled_patterns.get(key)
+            if pattern is None:
+                pattern = re.compile(self._build_pattern())
+                self._compiled_patterns[key] = pattern
+            self._pattern = pattern
+            self.cache_invalidated = False
+
     @property
     def value_int(self) -> int | None:
         return self._value_int
@@ -91,38 +116,40 @@ class BaseCounter(BaseElement, ICounter):
             # 整数の場合はvalue_intを通して値を更新
             self.value_int = new_value
         elif isinstance(new_value, str):
-            try:
-                # まずBaseElementの_valueを更新
-                self._value = new_value
-                # 文字列を整数に変換
-                value_int = self._parse_value(new_value)
-                # _value_intも更新（_valueは既に設定済みなので上書きしない）
-                self._value_int = value_int
-            except ValueError:
+            # まずBaseElementの_valueを更新 (変換に失敗しても文字列値は保持)
+            self._value = new_value
+            # 文字列を整数に変換。失敗した場合は数値表現をクリアする
+            value_int = self._parse_value(new_value)
+            if value_int is None:
                 log.error(f"Value '{new_value}' cannot be converted to counter value.")
-                self._value = new_value  # 変換に失敗しても文字列値は保持
-                self._value_int = None  # 数値表現はクリア
+            # _value_intも更新（_valueは既に設定済みなので上書きしない）
+            self._value_int = value_int
         else:
             # 非対応の型の場合
             super().set_value(new_value)  # BaseElementの実装に任せる
             self._value_int = None  # 数値表現はクリア
 
+    def _set_int(self, value: int) -> None:
+        """整数値が確定している場合に、文字列の解析を経ずに値を設定する"""
+        self._value_int = value
+        self._value = self.format_value(value)
+
     def add(self, value: int) -> None:
         """Add a value to the counter"""
         if value == 0:
             return
 
         if self._value_int is None:
-            self.value_int = value
+            self._set_int(value)
         else:
-            self.value_int = self._value_int + value
+            self._set_int(self._value_int + value)
 
     def increment(self) -> None:
         """Increment counter value by 1"""
         if self._value_int is None:
-            self.value_int = 1
+            self._set_int(1)
         else:
-            self.value_int = self._value_int + 1
+            self._set_int(self._value_int + 1)
 
     def standby(self) -> None:
         """カウンターの状態をリセットする"""
@@ -130,34 +157,40 @@ class BaseCounter(BaseElement, ICounter):
         self._value_int = None
         self.forward = None
         self.backward = None
-        print(f"counter standby: {self._value_int}")
+
+    def get_parse_state(self) -> Tuple:
+        return (self._value, self._value_int, self.forward, self.backward)
+
+    def restore_parse_state(self, state: Tuple) -> None:
+        self._value, self._value_int, self.forward, self.backward = state
 
     def parse(self, name: str) -> bool:
         """Parse counter value from name string"""
-        if self._pattern is None:
-            self.initialize_cache()
-            if self._pattern is None:
-                return False
-
-        match = self._pattern.search(name)
+        match = self.compiled_pattern.search(name)
         if match:
             extracted_value = match.group(self.id)
             self._value = extracted_value  # 文字列値を直接設定
 
-            try:
-                self._value_int = self._parse_value(extracted_value)
+            value_int = self._parse_value(extracted_value)
+            if value_int is not None:
+                self._value_int = value_int
                 self.forward = match.string[: match.start(self.id)]
                 self.backward = match.string[match.end(self.id) :]
                 return True
-            except ValueError:
-                log.error(f"Failed to parse counter value: {extracted_value}")
-                self._value_int = None
+            log.error(f"Failed to parse counter value: {extracted_value}")
+            self._value_int = None
 
         return False
 
-    def _parse_value(self, value_str: str) -> int:
-        """Parse string value to integer - to be overridden by specific counter types"""
-        return int(value_str)
+    def _parse_value(self, value_str: str) -> int | None:
+        """Parse string value to integer - to be overridden by specific counter types
+
+        解析できない場合は例外を送出せずにNoneを返す
+        """
+        digits = value_str[1:] if value_str[:1] == "-" else value_str
+        if digits.isascii() and digits.isdigit():
+            return int(value_str)
+        return None
 
     def take_over_counter(self, other: ICounter, force: bool = False) -> None:
         """Take over counter from another counter
@@ -178,10 +211,7 @@ class BaseCounter(BaseElement, ICounter):
             return
 
         # other_value_int は None でないので、そのまま設定
-        # set_value は str | None を期待するので、int を str に変換する
-        self.set_value(self.format_value(other_value_int))
-        # set_value は int も内部で処理してくれるが、型チェックエラーを避けるため str に変換するか、
-        # もしくは BaseElement.set_value の型ヒントを見直す必要があるかもしれない。
-        # ここでは一旦 int を渡す形にする (動作はするはず)
+        # 整数値は確定しているため、文字列に整形して再解析する必要はない
+        self._set_int(other_value_int)
 
         other.set_value(None) # 元のカウンターをリセット
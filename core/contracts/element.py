@@ -1,4 +1,7 @@
+import functools
+import random
 import re
+import sys
 from abc import ABC, abstractmethod
 from typing import Any, ClassVar, Dict, Optional, Set, Tuple
 
@@ -7,6 +10,9 @@ from ...utils.strings_utils import is_pascal_case, to_snake_case
 
 log = get_logger(__name__)
 
+# セパレーターは数種類しかないため、エスケープ結果を使い回す
+_escape_separator = functools.lru_cache(maxsize=None)(re.escape)
+
 
 class ElementConfig:
     """
@@ -46,8 +52,12 @@ class INameElement(ABC):
     名前要素のインターフェース
     """
 
+    __slots__ = ()
+
     element_type: ClassVar[str]
     config_fields: ClassVar[Dict[str, Any]]
+    # ABCへの isinstance は高コストなため、カウンターかどうかはクラス属性で判定する
+    is_counter: ClassVar[bool] = False
 
     @classmethod
     @abstractmethod
@@ -114,6 +124,20 @@ class INameElement(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_parse_state(self) -> Tuple:
+        """
+        名前の解析で決まる状態を返す。restore_parse_state で復元できる
+        """
+        pass
+
+    @abstractmethod
+    def restore_parse_state(self, state: Tuple) -> None:
+        """
+        get_parse_state で取得した状態を復元する
+        """
+        pass
+
     @abstractmethod
     def generate_random_value(self) -> Tuple[str, str]:
         """
@@ -129,6 +153,18 @@ class BaseElement(INameElement, ABC):
     オペレーター実行時には standby により値だけをリセットする。
     """
 
+    # 一括リネームでは要素が大量に生成されるため、インスタンス辞書を持たせない
+    __slots__ = (
+        "_id",
+        "_order",
+        "_enabled",
+        "_separator",
+        "_escaped_separator",
+        "_value",
+        "_pattern",
+        "cache_invalidated",
+    )
+
     config_fields: ClassVar[Dict[str, Any]] = {
         "type": str,
         "id": str,
@@ -137,6 +173,9 @@ class BaseElement(INameElement, ABC):
         "separator": str,
     }
 
+    # generate_random_value 用の乱数生成器。テストでは seed() で再現性を持たせられる
+    _rng: ClassVar[random.Random] = random.Random()
+
     @classmethod
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -182,10 +221,13 @@ class BaseElement(INameElement, ABC):
         return set(cls.config_fields.keys())
 
     def __init__(self, element_config: ElementConfig):
-        self._id = element_config.id
+        # IDは解析時のグループ名や更新値の辞書のキーとして何度も参照されるため、インターンしておく
+        self._id = sys.intern(element_config.id)
         self._order = element_config.order
         self._enabled = element_config.enabled
         self._separator = element_config.separator
+        # パターン構築のたびにエスケープしないよう事前に求めておく
+        self._escaped_separator = _escape_separator(self._separator)
 
         self._value: str | None = None
         self._pattern: re.Pattern[str] | None = None
@@ -207,6 +249,11 @@ class BaseElement(INameElement, ABC):
     def separator(self) -> str:
         return self._separator
 
+    @property
+    def escaped_separator(self) -> str:
+        """正規表現用にエスケープ済みのセパレーター"""
+        return self._escaped_separator
+
     @property
     def value(self) -> str | None:
         return self._value
@@ -230,6 +277,23 @@ class BaseElement(INameElement, ABC):
             self._pattern = re.compile(pattern_str)
             self.cache_invalidated = False
 
+    def invalidate_cache(self) -> None:
+        """
+        パターンの構築に使う設定が変わったときに呼び、次回の参照時に再コンパイルさせる
+        """
+        self.cache_invalidated = True
+
+    @property
+    def compiled_pattern(self) -> re.Pattern[str]:
+        """
+        コンパイル済みの正規表現パターン。
+        未初期化またはキャッシュが無効化されている場合はここでコンパイルする。
+        """
+        if self.cache_invalidated or self._pattern is None:
+            log.debug(f"Cache is not initialized for {self.id}. Initializing cache...")
+            self.initialize_cache()
+        return self._pattern
+
     def standby(self) -> None:
         """
         オペレーター実行前に呼ばれ、解析のための状態（値）をリセットする。
@@ -237,17 +301,17 @@ class BaseElement(INameElement, ABC):
         """
         self._value = None
 
+    def get_parse_state(self) -> Tuple:
+        return (self._value,)
+
+    def restore_parse_state(self, state: Tuple) -> None:
+        (self._value,) = state
+
     def parse(self, name: str) -> bool:
         """
         キャッシュ済みのパターンを用いて名前文字列から値を抽出する。
         """
-        # 初期化処理が呼ばれていなかった場合の保険として
-        if self._pattern is None:
-            log.debug(f"Cache is not initialized for {self.id}. Initializing cache...")
-            self.initialize_cache()
-            if self._pattern is None:
-                return False
-        match = self._pattern.search(name)
+        match = self.compiled_pattern.search(name)
         if match:
             self._value = match.group(self.id)
             return True
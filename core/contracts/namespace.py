@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Set
+from typing import Iterable, Set
 
 
 class INamespace(ABC):
@@ -7,6 +7,8 @@ class INamespace(ABC):
     名前空間のインターフェース
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def contains(self, name: str) -> bool:
         """
@@ -51,12 +53,34 @@ class INamespace(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_existing(self, names: Iterable[str]) -> Set[str]:
+        """
+        指定した名前のうち、この名前空間に既に存在するものをまとめて取得する
+
+        Args:
+            names: チェックする名前
+
+        Returns:
+            存在する名前の集合
+        """
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        名前空間に含まれる名前の数
+        """
+        pass
+
 
 class Namespace(INamespace):
     """
     汎用名前空間コンテナ
     """
 
+    __slots__ = ("_names", "_initializer")
+
     def __init__(self, initializer):
         """
         名前空間を初期化する
@@ -77,7 +101,8 @@ class Namespace(INamespace):
         """
         names = self._initializer()
         if names:
-            self._names = set(names)
+            # 初期化関数は毎回新しい集合を返すため、集合ならコピーせずにそのまま保持する
+            self._names = names if isinstance(names, set) else set(names)
 
     def contains(self, name: str) -> bool:
         return name in self._names
@@ -86,9 +111,15 @@ class Namespace(INamespace):
         self._names.add(name)
 
     def remove(self, name: str) -> None:
-        if name in self._names:
-            self._names.remove(name)
+        # 存在確認と削除でハッシュを2回引かないよう discard を使う
+        self._names.discard(name)
 
     def update(self, old_name: str, new_name: str) -> None:
         self.remove(old_name)
         self.add(new_name)
+
+    def find_existing(self, names: Iterable[str]) -> Set[str]:
+        return self._names.intersection(names)
+
+    def __len__(self) -> int:
+        return len(self._names)
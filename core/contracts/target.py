@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Optional, Set, Type
+from typing import Any, ClassVar, Dict, Optional, Set, Type
 
 import bpy
 from bpy.types import ID as BlenderID
@@ -12,10 +12,19 @@ from ...utils.logging import get_logger
 
 log = get_logger(__name__)
 
+# ID.rename は Blender 4.3 以降で利用できる
+# TODO: バージョン依存を集約
+_ID_RENAME_SUPPORTED = bpy.app.version >= (4, 3, 0)
+
+# データの型 -> ID.rename を使うか (isinstance による判定は型ごとに一度だけ行う)
+_uses_id_rename: Dict[type, bool] = {}
+
 
 class IRenameTarget(ABC):
     """リネーム対象インターフェース"""
 
+    __slots__ = ()
+
     bl_type: ClassVar[str]  # Blenderでのタイプ識別子
     ol_type: ClassVar[int]  # アウトライナーでのタイプ識別子
     ol_idcode: ClassVar[int]  # アウトライナーでのIDコード (IDサブクラス以外は0)
@@ -73,6 +82,9 @@ class IRenameTarget(ABC):
 class BaseRenameTarget(IRenameTarget, ABC):
     """リネームターゲットのベースクラス"""
 
+    # 選択中の要素ごとに生成されるため、インスタンス辞書を持たせない
+    __slots__ = ("_data", "_context")
+
     bl_type: str = None
     ol_type: int = None
     ol_idcode: int = None
@@ -91,11 +103,14 @@ class BaseRenameTarget(IRenameTarget, ABC):
         return self._data.name
 
     def set_name(self, name: str, *, force_rename: bool = False) -> str:
-        if isinstance(self._data, BlenderID) and bpy.app.version >= (
-            4,
-            3,
-            0,
-        ):  # TODO: バージョン依存を集約
+        data_type = type(self._data)
+        uses_id_rename = _uses_id_rename.get(data_type)
+        if uses_id_rename is None:
+            uses_id_rename = _uses_id_rename[data_type] = (
+                _ID_RENAME_SUPPORTED and isinstance(self._data, BlenderID)
+            )
+
+        if uses_id_rename:
             return self._data.rename(name, mode="ALWAYS" if force_rename else "NEVER")
         else:
             force_rename and log.warning(
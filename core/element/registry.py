@@ -3,7 +3,6 @@ from typing import Dict, List, Optional, Type
 
 from ...utils.logging import get_logger
 from ..contracts.element import ElementConfig, INameElement
-from ..contracts.counter import ICounter
 
 log = get_logger(__name__)
 
@@ -94,10 +93,7 @@ class ElementRegistry:
             TypeError: クラスがINameElementを実装していない場合
             ValueError: 既に登録済みの型名の場合
         """
-        if not (
-            issubclass(element_class, INameElement)
-            or isinstance(element_class, ICounter)
-        ):
+        if not issubclass(element_class, INameElement):
             raise TypeError(
                 f"要素クラスはINameElementインターフェースを実装する必要があります: {element_class.__name__} {element_class.__bases__}"
             )
@@ -1,10 +1,12 @@
-from typing import Dict, List
+import sys
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from ..contracts.namespace import INamespace
 from ..contracts.target import IRenameTarget
 from ..namespace.manager import NamespaceCache
 from ..pattern.model import NamingPattern
-from ...elements.counter_element import NumericCounter
+from ...elements.counter_element import zero_padded_table
 from ...utils.logging import get_logger
 
 log = get_logger(__name__)
@@ -19,12 +21,17 @@ class ConflictResolver:
     STRATEGY_COUNTER = "counter"  # カウンターを用いて解決
     STRATEGY_FORCE = "force"  # 強制上書き
 
+    # 候補名を保持する (前の部分, 後ろの部分, ゼロ埋め桁数) の組の最大数
+    CANDIDATE_CACHE_SIZE = 256
+
     def __init__(self):
         """
         コンフリクトリゾルバーを初期化する
         """
         self._namespace_cache = NamespaceCache()
         self.resolved_conflicts: List[Dict] = []
+        # (前の部分, 後ろの部分, ゼロ埋め桁数) -> {値: 候補名}
+        self._candidate_names: Dict[Tuple, Dict[int, str]] = {}
 
     def resolve_name_conflict(
         self,
@@ -50,7 +57,7 @@ class ConflictResolver:
 
         # ターゲットの名前空間を取得
         namespace = self._get_namespace(target)
-        if not namespace:
+        if namespace is None:
             log.warning(f"Namespace not found for target: {target}")
             return proposed_name  # 名前空間がない場合は提案名をそのまま返す
 
@@ -58,7 +65,7 @@ class ConflictResolver:
         original_name = target.get_name()
 
         # 名前が競合するか確認
-        if not self._is_name_in_conflict(proposed_name, namespace, target):
+        if not self._is_name_in_conflict(proposed_name, namespace, original_name):
             # 競合がなければ名前空間を更新して提案名を返す
             if original_name != proposed_name:  # 名前が変わる場合のみ更新
                 namespace.update(original_name, proposed_name)
@@ -80,18 +87,74 @@ class ConflictResolver:
 
         return final_name
 
+    def group_by_namespace(self, targets: List[IRenameTarget]) -> Dict[str, List[int]]:
+        """
+        ターゲットを名前空間のキーごとにまとめる
+
+        Args:
+            targets: リネーム対象のリスト
+
+        Returns:
+            名前空間のキー -> ターゲットのインデックスのリスト（元の順序を保持）
+        """
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for idx, target in enumerate(targets):
+            groups[sys.intern(target.get_namespace_key())].append(idx)
+        return groups
+
+    def get_group_namespaces(
+        self, targets: List[IRenameTarget], groups: Dict[str, List[int]]
+    ) -> Dict[str, INamespace]:
+        """
+        グループごとの名前空間をまとめて取得する
+
+        Args:
+            targets: リネーム対象のリスト
+            groups: group_by_namespace で求めたターゲットのグループ
+
+        Returns:
+            名前空間のキー -> 名前空間
+        """
+        # 同じグループのターゲットは名前空間を共有するため、先頭のターゲットから取得する
+        return {
+            key: self._get_namespace(targets[indices[0]])
+            for key, indices in groups.items()
+        }
+
+    def find_conflicting_indices(
+        self,
+        proposed_names: List[str],
+        groups: Dict[str, List[int]],
+        namespaces: Dict[str, INamespace],
+    ) -> Set[int]:
+        """
+        既存の名前と競合する提案名を名前空間ごとに一括で検出する
+
+        Args:
+            proposed_names: 各ターゲットの提案名（ターゲットと同じ順序）
+            groups: group_by_namespace で求めたターゲットのグループ
+            namespaces: get_group_namespaces で取得した名前空間
+
+        Returns:
+            競合の可能性があるターゲットのインデックス集合
+        """
+        conflicted: Set[int] = set()
+        for key, indices in groups.items():
+            existing = namespaces[key].find_existing(proposed_names[i] for i in indices)
+            conflicted.update(i for i in indices if proposed_names[i] in existing)
+        return conflicted
+
     def apply_namespace_update(
-        self, target: IRenameTarget, old_name: str, new_name: str
+        self, namespace: INamespace, old_name: str, new_name: str
     ) -> None:
         """
         実際の名前空間を更新する
 
         Args:
-            target: リネーム対象
+            namespace: 更新する名前空間
             old_name: 古い名前
             new_name: 新しい名前
         """
-        namespace = self._get_namespace(target)
         namespace.update(old_name, new_name)
 
     def _get_namespace(self, target: IRenameTarget) -> INamespace:
@@ -107,7 +170,7 @@ class ConflictResolver:
         return self._namespace_cache.get_namespace(target)
 
     def _is_name_in_conflict(
-        self, name: str, namespace: INamespace, target: IRenameTarget
+        self, name: str, namespace: INamespace, current_name: str
     ) -> bool:
         """
         名前が競合するか確認する
@@ -115,17 +178,14 @@ class ConflictResolver:
         Args:
             name: チェックする名前
             namespace: 名前空間
-            target: リネーム対象（現在の名前を除外するため）
+            current_name: ターゲットの現在の名前（競合から除外するため）
 
         Returns:
             競合がある場合はTrue
         """
-        # ターゲット自身の現在の名前は競合とみなさない
-        if name == target.get_name():
-            return False
-
-        # 名前空間で名前の競合をチェック
-        return namespace.contains(name)
+        # 名前空間で名前の競合をチェックし、存在する場合のみ
+        # ターゲット自身の現在の名前かどうかを確認する (呼び出し元で取得済みの名前を使う)
+        return namespace.contains(name) and name != current_name
 
     def _resolve_with_counter(
         self, pattern: NamingPattern, name: str, namespace: INamespace
@@ -141,16 +201,13 @@ class ConflictResolver:
         Returns:
             解決された名前
         """
-        # NumericCounterを探す
-        # TODO: PatternやPatternFacadeを通じてカウンター要素を取得すべき
-        numeric_counter = [
-            e for e in pattern.elements if isinstance(e, NumericCounter)
-        ][-1]
+        # NumericCounterを探す (パターンが要素の設定時に求めたものを使う)
+        numeric_counter = pattern.last_numeric_counter
         # blender_counter = [
         #     e for e in pattern.elements if isinstance(e, BlenderCounter)
         # ][-1]
 
-        log.info(f"numeric_counter: {numeric_counter.value}")
+        log.info(f"numeric_counter: {numeric_counter and numeric_counter.value}")
         # log.info(f"blender_counter: {blender_counter.value}")
 
         # # BlenderCounterの値を優先的に使用
@@ -167,36 +224,127 @@ class ConflictResolver:
 
         if not numeric_counter:
             # カウンター要素がない場合は単純にサフィックスを追加
-            suffix = 1
-            new_name = f"{name}.{suffix:03d}"
-
-            while namespace.contains(new_name):
-                suffix += 1
-                new_name = f"{name}.{suffix:03d}"
-
-                # 無限ループ防止
-                if suffix > 999:
-                    break
-
-            return new_name
+            # 探索範囲は名前空間の大きさで抑えられ、必ず見つかる (3桁を使い切った場合は 1000 以降になる)
+            # 候補ごとに書式指定を解析しないよう、ゼロ埋め済みのテーブルから組み立てる
+            prefix, padded = f"{name}.", zero_padded_table(3)
+            _, free_name = self._find_first_free(
+                namespace,
+                self._cached_name_maker(
+                    (prefix, "", None),
+                    lambda v: prefix + (padded[v] if v < 1000 else str(v)),
+                ),
+                1,
+                sys.maxsize,
+            )
+            return free_name
 
         # 競合が解消されるまでカウンターを増分
-        start_value = numeric_counter.value_int or 1  # incrementを利用する場合不要
-        max_value = start_value + 1000
-
-        for idx in range(start_value, max_value):
-            # TODO: Patternがincrementすべき
-            numeric_counter.increment()
+        # TODO: Patternがincrementすべき
+        numeric_counter.increment()
+        parts = pattern.render_name_parts(numeric_counter)
+        if parts is None:
+            # カウンターがレンダリングされない場合は候補名が変わらない
             proposed_name = pattern.render_name()
-            # proposed_name = numeric_counter.gen_proposed_name(idx)
-            log.debug(f"resolving with counter: {proposed_name}")
-
             if not namespace.contains(proposed_name):
                 return proposed_name
+            return f"{name}_unsolved_conflict"
+
+        # カウンター以外の部分は変わらないため、前後の文字列を固定して候補名を組み立てる
+        prefix, suffix = parts
+        # 候補ごとに書式化しないよう、ゼロ埋め済みのテーブルから連結して組み立てる
+        padding = numeric_counter.padding
+        padded = zero_padded_table(padding)
+        first_value = numeric_counter.value_int
+        found = self._find_first_free(
+            namespace,
+            self._cached_name_maker(
+                (prefix, suffix, padding),
+                lambda v: prefix
+                + (padded[v] if 0 <= v < len(padded) else str(v).zfill(padding))
+                + suffix,
+            ),
+            first_value,
+            first_value + 1000,
+        )
+        if found is not None:
+            value, proposed_name = found
+            numeric_counter.value_int = value
+            log.debug(f"resolving with counter: {proposed_name}")
+            return proposed_name
 
         # 最大試行回数に達した場合
+        numeric_counter.value_int = first_value + 999
         return f"{name}_unsolved_conflict"
 
+    def _cached_name_maker(
+        self, key: Tuple, make_name: Callable[[int], str]
+    ) -> Callable[[int], str]:
+        """
+        生成した候補名を key ごとに記録する関数を返す
+
+        同じ名前に揃えられた兄弟のターゲットは前後の部分が共通で、
+        それぞれが同じ候補名を先頭から生成し直すため、生成済みの名前を使い回す
+
+        Args:
+            key: 候補名を決める (前の部分, 後ろの部分, ゼロ埋め桁数) の組
+            make_name: 値から候補名を生成する関数
+
+        Returns:
+            make_name と同じ結果を返す関数
+        """
+        names = self._candidate_names.get(key)
+        if names is None:
+            if len(self._candidate_names) >= self.CANDIDATE_CACHE_SIZE:
+                self._candidate_names.clear()
+            names = self._candidate_names[key] = {}
+
+        def cached_make_name(value: int) -> str:
+            name = names.get(value)
+            if name is None:
+                name = names[value] = make_name(value)
+            return name
+
+        return cached_make_name
+
+    def _find_first_free(
+        self,
+        namespace: INamespace,
+        make_name: Callable[[int], str],
+        start: int,
+        stop: int,
+    ) -> Optional[Tuple[int, str]]:
+        """
+        start 以上 stop 未満の値のうち、名前が名前空間に存在しない最小の値を求める
+
+        候補名はまとめて生成し、名前空間との照合を1回の集合演算で行う。
+        連番が密に埋まっている場合に備えて、まとめる件数は 1, 2, 4, ... と倍々に増やす
+
+        Args:
+            namespace: 名前空間
+            make_name: 値から候補名を生成する関数
+            start: 最初の値
+            stop: 探索を打ち切る値（この値は含まない）
+
+        Returns:
+            (値, 候補名)。見つからない場合はNone
+        """
+        # 候補名は値ごとに異なるため、使用済みの値は名前空間の名前の数を超えない
+        # したがって start から len(namespace) 個先までに必ず空きがある
+        stop = min(stop, start + len(namespace) + 1)
+
+        value = start
+        size = 1
+        while value < stop:
+            end = min(value + size, stop)
+            candidates = [make_name(v) for v in range(value, end)]
+            existing = namespace.find_existing(candidates)
+            for offset, candidate in enumerate(candidates):
+                if candidate not in existing:
+                    return value + offset, candidate
+            value = end
+            size *= 2
+        return None
+
     # # デフォルトの挙動としては、現在の「現在値からのインクリメント」方式の方が、パフォーマンスと設計の一貫性の観点からバランスが良い
     # def _find_unused_min_counter_value(
     #     self, pattern: NamingPattern, namespace: INamespace, name: str, start_value: int = 1
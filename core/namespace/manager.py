@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Dict, List
 
 from ..contracts.namespace import INamespace, Namespace
@@ -29,7 +30,8 @@ class NamespaceCache:
         Returns:
             ターゲットの名前空間
         """
-        key = target.get_namespace_key()
+        # キーはターゲットごとに生成されることがあるため、インターンして比較を軽くする
+        key = sys.intern(target.get_namespace_key())
 
         # キャッシュにある場合はそれを返す
         if key in self._namespaces:
@@ -37,7 +39,7 @@ class NamespaceCache:
 
         # ターゲットに名前空間の作成を依頼
         namespace = Namespace(target.create_namespace)
-        if namespace:
+        if namespace is not None:
             self._namespaces[key] = namespace
             return namespace
 
@@ -97,25 +97,35 @@ class PatternFacade:
         return self._pattern_cache.values()
 
     # 同期処理
-    def synchronize_patterns(self) -> None:
+    def synchronize_patterns(
+        self, patterns: Optional[List["NamingPatternProperty"]] = None
+    ) -> None:
         """
         キャッシュとパターンの同期処理
 
         1. 新規・変更パターンの作成と登録
         2. 削除されたパターンの除去
+
+        Args:
+            patterns: 同期するパターン。省略した場合はすべてのパターンを確認する
         """
         if not self._context:
             log.warning("コンテキストが無効なため同期をスキップします")
             return
 
-        self._synchronize_modified_patterns()
+        self._synchronize_modified_patterns(patterns)
         self._remove_deleted_patterns()
 
-    def _synchronize_modified_patterns(self) -> None:
+    def _synchronize_modified_patterns(
+        self, patterns: Optional[List["NamingPatternProperty"]] = None
+    ) -> None:
         """新規または変更されたパターンを同期"""
-        patterns = prefs(self._context).patterns
+        all_patterns = prefs(self._context).patterns
+        if patterns is None:
+            patterns = all_patterns
         cached_pattern_ids = set(self._pattern_cache.keys())
 
+        # 同期済みのパターンは modified が解除されるため、渡されたパターンでも再作成しない
         for pattern in patterns:
             if self._should_update_pattern(pattern, cached_pattern_ids):
                 try:
@@ -128,8 +138,9 @@ class PatternFacade:
                     continue
 
         # キャッシュの整合性を確認
+        prefs_pattern_ids = {p.id for p in all_patterns}
         for pattern_id in cached_pattern_ids:
-            if pattern_id not in [p.id for p in patterns]:
+            if pattern_id not in prefs_pattern_ids:
                 log.debug(f"削除されたパターンをキャッシュから削除: {pattern_id}")
                 del self._pattern_cache[pattern_id]
 
@@ -75,15 +75,16 @@ class PatternFactory:
         """要素の設定を作成"""
         pattern_elements = pattern_data.elements
 
+        # 順序値はコレクション内の位置と一致するとは限らないため、位置を順序として使う
         elements_config = []
-        for element_data in pattern_elements:
-            element_config = self._convert_to_element_config(element_data)
+        for order, element_data in enumerate(pattern_elements):
+            element_config = self._convert_to_element_config(element_data, order)
             elements_config.append(element_config)
 
         return elements_config
 
     def _convert_to_element_config(
-        self, element_data: IPropertyGroup
+        self, element_data: IPropertyGroup, order: int
     ) -> Optional[ElementConfig]:
         """BlenderPropertyをElementConfigに変換"""
         element_type = element_data.element_type
@@ -107,7 +108,7 @@ class PatternFactory:
         config_data = {
             "type": element_type,
             "id": getattr(element_data, "id", ""),
-            "order": getattr(element_data, "order", 0),
+            "order": order,
             "enabled": getattr(element_data, "enabled", True),
             "separator": getattr(element_data, "separator", "_"),
         }
@@ -1,7 +1,9 @@
 import itertools
+import logging
 import random
-from typing import Dict, List, Optional, Self
+from typing import Dict, List, Optional, Self, Tuple
 
+from ..contracts.counter import ICounter
 from ..contracts.element import INameElement
 from ...elements.counter_element import (
     BlenderCounter,
@@ -17,6 +19,9 @@ class NamingPattern:
     名前を構築するための複数の要素を含む命名パターンを表す
     """
 
+    # 解析結果を保持する名前の最大数
+    PARSE_CACHE_SIZE = 1024
+
     def __init__(
         self,
         id: str,
@@ -31,6 +36,46 @@ class NamingPattern:
         """
         self.id = id
         self.elements = elements
+        # render_name はターゲットごとに呼ばれるため、結合前の部分を格納するリストを使い回す
+        self._render_buffer: List[str] = []
+
+    @property
+    def elements(self) -> List[INameElement]:
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements: List[INameElement]) -> None:
+        self._elements = elements
+        # カウンター要素は競合解決のたびに参照されるため、要素の設定時に抽出しておく
+        self._counter_elements = tuple(e for e in elements if e.is_counter)
+        # 名前の解析ごとに探さないよう、値を引き継ぐカウンターの組も求めておく
+        self._blender_counter = next(
+            (e for e in self._counter_elements if isinstance(e, BlenderCounter)), None
+        )
+        self._numeric_counter = next(
+            (e for e in self._counter_elements if isinstance(e, NumericCounter)), None
+        )
+        # 競合解決には最後のNumericCounterを使う
+        self._last_numeric_counter = next(
+            (
+                e
+                for e in reversed(self._counter_elements)
+                if isinstance(e, NumericCounter)
+            ),
+            None,
+        )
+        # 名前 -> 解析後の各要素の状態。要素が変わると解析結果も変わるため作り直す
+        self._parse_cache: Dict[str, Tuple[Tuple, ...]] = {}
+
+    @property
+    def counter_elements(self) -> Tuple[ICounter, ...]:
+        """パターンに含まれるカウンター要素（要素順）"""
+        return self._counter_elements
+
+    @property
+    def last_numeric_counter(self) -> Optional[NumericCounter]:
+        """パターンに含まれる最後のNumericCounter（競合解決に使う）"""
+        return self._last_numeric_counter
 
     def get_element_by_id(self, element_id: str) -> INameElement:
         """
@@ -57,6 +102,13 @@ class NamingPattern:
         Args:
             name: 解析する名前
         """
+        # 同じ名前は一括リネーム中に何度も解析されるため、解析後の状態を再利用する
+        cached = self._parse_cache.get(name)
+        if cached is not None:
+            for element, state in zip(self.elements, cached):
+                element.restore_parse_state(state)
+            return self
+
         # すべての要素をリセット
         for element in self.elements:
             element.standby()
@@ -66,20 +118,24 @@ class NamingPattern:
             element.parse(name)
 
         # BlenderCounterの値をNumericCounterにコピー
-        blender_counter = next(
-            e for e in self.elements if isinstance(e, BlenderCounter)
-        )
-        numeric_counter = next(
-            e for e in self.elements if isinstance(e, NumericCounter)
-        )  # FIXME: StopIteration: カウンター要素が無い場合(できれば必ず存在するようにしたい)
-        if blender_counter.value:
-            numeric_counter.take_over_counter(blender_counter)
-
-        log.debug(f"NamingPattern.parse_name(name={name})")
-        log.debug(
-            "parsed elements:\n"
-            + "\n".join([f"  - {e.id}: {e.value}" for e in self.elements])
-        )
+        # NOTE: カウンター要素が無い場合は引き継がない(できれば必ず存在するようにしたい)
+        blender_counter = self._blender_counter
+        numeric_counter = self._numeric_counter
+        if blender_counter is not None and numeric_counter is not None:
+            if blender_counter.value:
+                numeric_counter.take_over_counter(blender_counter)
+
+        # ターゲットごとに呼ばれるため、ログを出さない場合はメッセージを組み立てない
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug(f"NamingPattern.parse_name(name={name})")
+            log.debug(
+                "parsed elements:\n"
+                + "\n".join([f"  - {e.id}: {e.value}" for e in self.elements])
+            )
+
+        if len(self._parse_cache) >= self.PARSE_CACHE_SIZE:
+            self._parse_cache.clear()
+        self._parse_cache[name] = tuple(e.get_parse_state() for e in self.elements)
 
         return self
 
@@ -124,27 +180,59 @@ class NamingPattern:
         Returns:
             レンダリングされた名前
         """
-        # 有効で値を持つ要素のrender結果を収集
-        elements_parts = []
+        # 有効で値を持つ要素のrender結果から、セパレータと値を順に収集
+        name_parts = self._render_buffer
+        name_parts.clear()
         for element in self.elements:
             if element.enabled and element.value is not None:
                 rendered = element.render()
                 if rendered:
-                    elements_parts.append(rendered)
+                    sep, value = rendered
+                    if name_parts:  # 前の要素が存在する
+                        name_parts.append(sep)
+                    name_parts.append(value)
 
-        if not elements_parts:
+        if not name_parts:
             return ""
 
         # セパレータと値を結合して名前を生成
+        name = "".join(name_parts)
+        log.debug(f"render_name(): {name}")
+        return name
+
+    def render_name_parts(self, target: INameElement) -> Optional[Tuple[str, str]]:
+        """
+        レンダリングした名前のうち、指定要素の値より前と後ろの部分を返す
+
+        カウンターの値だけを変えて候補名を繰り返し生成する場合に、
+        パターン全体を毎回レンダリングせずに済むようにする。
+
+        Args:
+            target: 値の位置を求める要素
+
+        Returns:
+            (前の部分, 後ろの部分)。指定要素がレンダリングされない場合はNone
+        """
         name_parts = []
-        for sep, value in elements_parts:
-            if name_parts:  # 前の要素が存在する
+        target_index = None
+        for element in self.elements:
+            if not (element.enabled and element.value is not None):
+                continue
+            rendered = element.render()
+            if not rendered:
+                continue
+            sep, value = rendered
+            if name_parts:
                 name_parts.append(sep)
+            if element is target:
+                target_index = len(name_parts)
             name_parts.append(value)
 
-        name = "".join(name_parts)
-        log.debug(f"render_name(): {name}")
-        return name
+        if target_index is None:
+            return None
+        return "".join(name_parts[:target_index]), "".join(
+            name_parts[target_index + 1 :]
+        )
 
     def validate(self) -> List[str]:
         """
@@ -1,4 +1,6 @@
-from typing import Dict, List
+import logging
+from collections import defaultdict
+from typing import Dict, List, Set
 
 from bpy.types import Context
 
@@ -43,7 +45,9 @@ class RenameService:
             # 空のターゲットリストでRenameContextを作成
             return RenameContext([], pattern)
 
-        log.info(f"targets: {[t.get_name() for t in targets]}")
+        # 名前の取得はRNAへのアクセスになるため、ログを出さない場合は行わない
+        if log.is_enabled_for(logging.INFO):
+            log.info(f"targets: {[t.get_name() for t in targets]}")
         return RenameContext(targets, pattern)
 
     def generate_rename_plan(
@@ -58,50 +62,130 @@ class RenameService:
         for element_id in updates.keys():
             try:
                 element = self.r_ctx.pattern.get_element_by_id(element_id)
-                if isinstance(element, ICounter):
+                if element.is_counter:
                     counter_elements.append(element)
             except ValueError:
                 continue
 
-        for idx, target in enumerate(self.r_ctx.targets):
-            # ターゲットの名前を解析
-            self.r_ctx.pattern.parse_name(target.get_name())
-
-            # その他の要素を更新
-            self.r_ctx.pattern.update_elements(updates)
-
-            # カウンター要素に対してインデックスを加算
-            for counter in counter_elements:
-                counter.add(idx)
+        pattern = self.r_ctx.pattern
+        targets = self.r_ctx.targets
+
+        # 1. 全ターゲットの提案名を先に生成する
+        # NOTE: パターンはターゲットごとの名前から再構築されるため、
+        # render_name() の結果はループ不変ではない。名前の取得のみ1回にまとめる
+        original_names = [target.get_name() for target in targets]
+        proposed_names = [
+            self._render_proposed_name(name, idx, updates, counter_elements)
+            for idx, name in enumerate(original_names)
+        ]
+
+        # 2. 既存の名前との競合を名前空間ごとに一括で検出する
+        # 名前空間のキーはターゲットごとに1度だけ求め、以降の処理でも使い回す
+        groups = self._conflict_resolver.group_by_namespace(targets)
+        namespace_keys: List[str] = [""] * len(targets)
+        for key, indices in groups.items():
+            for idx in indices:
+                namespace_keys[idx] = key
+        # 名前空間もグループごとに1度だけ取得し、競合の検出と更新で使い回す
+        namespaces = self._conflict_resolver.get_group_namespaces(targets, groups)
+        conflicted = self._conflict_resolver.find_conflicting_indices(
+            proposed_names, groups, namespaces
+        )
 
-            proposed_name = self.r_ctx.pattern.render_name()
-            new_name = self._conflict_resolver.resolve_name_conflict(
-                target, self.r_ctx.pattern, proposed_name, "counter"
-            )
+        # 3. 競合の可能性があるものだけ個別に解決する
+        assigned: Dict[str, Set[str]] = defaultdict(set)
+        for idx, target in enumerate(targets):
+            original_name = original_names[idx]
+            proposed_name = proposed_names[idx]
+            assigned_names = assigned[namespace_keys[idx]]
+
+            # 名前が変わらない場合、名前空間にあるのはターゲット自身の名前なので競合ではない
+            if (
+                proposed_name
+                and (idx not in conflicted or proposed_name == original_name)
+                and proposed_name not in assigned_names
+            ):
+                # 既存の名前にも先行ターゲットの名前にも無いので競合しない
+                if original_name != proposed_name:
+                    self._conflict_resolver.apply_namespace_update(
+                        namespaces[namespace_keys[idx]], original_name, proposed_name
+                    )
+                new_name = proposed_name
+            else:
+                # カウンターによる解決にはこのターゲットのパターン状態が必要
+                self._render_proposed_name(
+                    original_name, idx, updates, counter_elements
+                )
+                new_name = self._conflict_resolver.resolve_name_conflict(
+                    target, pattern, proposed_name, "counter"
+                )
+            assigned_names.add(new_name)
 
             self.r_ctx.results.append(
                 RenameResult(
                     target=target,
-                    original_name=target.get_name(),
+                    original_name=original_name,
                     proposed_name=proposed_name,
                     final_name=new_name,
                 )
             )
 
-        log.info(
-            f"results:\n{chr(10).join([f'{r.original_name} -> {r.final_name}' for r in self.r_ctx.results])}"
-        )
+        if log.is_enabled_for(logging.INFO):
+            log.info(
+                f"results:\n{chr(10).join([f'{r.original_name} -> {r.final_name}' for r in self.r_ctx.results])}"
+            )
         return self.r_ctx
 
+    def _render_proposed_name(
+        self,
+        name: str,
+        idx: int,
+        updates: Dict[str, str],
+        counter_elements: List[ICounter],
+    ) -> str:
+        """
+        ターゲットの名前にパターンの更新を適用した提案名を生成する
+        """
+        pattern = self.r_ctx.pattern
+
+        # ターゲットの名前を解析
+        pattern.parse_name(name)
+
+        # その他の要素を更新
+        pattern.update_elements(updates)
+
+        # カウンター要素に対してインデックスを加算
+        for counter in counter_elements:
+            counter.add(idx)
+
+        return pattern.render_name()
+
     def apply_rename_plan(self) -> None:
         """
         リネーム結果を実際のオブジェクトに適用する
         """
-        # シンプルな解決策: 一度すべてのターゲットをランダムな名前に変更する
+        # 名前が実際に変わるものだけを対象にし、RNAへの書き込み回数を抑える
+        pending = [
+            result
+            for result in self.r_ctx.results
+            if result.approved
+            and result.final_name
+            and result.final_name != result.original_name
+        ]
+
+        # 他のターゲットの現在の名前を使う場合は、一度一時的な名前に変更して空けておく
         # これをしないと、Namespaceで重複がない場合でも、.001が発生する
-        for target in self.r_ctx.targets:
-            target.set_name(f"__tmp_{id(target)}_{hash(target.get_name())}")
+        # それ以外のターゲットは一時的な名前を経由せず、1回の書き込みで済ませる
+        original_names = {result.original_name for result in pending}
+        swapping = [r for r in pending if r.final_name in original_names]
+        direct = [r for r in pending if r.final_name not in original_names]
+
+        for result in swapping:
+            result.target.set_name(f"__tmp_{id(result.target)}")
+
+        # 直接リネームするものを先に適用し、その元の名前を空ける
+        for result in direct:
+            result.target.set_name(result.final_name)
 
-        for result in self.r_ctx.results:
-            if result.approved:
-                result.target.set_name(result.final_name)
+        for result in swapping:
+            result.target.set_name(result.final_name)
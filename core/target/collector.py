@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from typing import Any, List, Optional, Set, Type, Union
 
 import bpy
 from bpy.types import Context, EditBone, Node, Object, PoseBone
@@ -123,15 +123,16 @@ class TargetCollector:
             return []
 
         # --- 2. 必要なキャッシュタイプの特定 (1回目のループ) ---
+        # item と同じ順序でクラスを一時保存
+        # 収集元の判定はスコープごとに1度だけ行う
+        find_target_class = self.registry.get_target_class_finder(self.scope)
+        target_classes: List[Optional[Type[IRenameTarget]]] = [
+            find_target_class(item) for item in primary_items
+        ]
+
+        # コレクションタイプはクラスごとに決まるため、重複を除いたクラスから求める
         required_types: Set[Type] = set()
-        target_class_map: Dict[int, Optional[Type[IRenameTarget]]] = (
-            {}
-        )  # item とクラスのマッピングを一時保存
-
-        for idx, item in enumerate(primary_items):
-            target_cls = self.registry.find_target_class_for_item(item, self.scope)
-            target_class_map[idx] = target_cls
-
+        for target_cls in set(target_classes):
             if target_cls:
                 # このクラスが必要とするコレクションタイプを取得
                 collection_type = target_cls.get_collection_type()
@@ -148,9 +149,7 @@ class TargetCollector:
             log.debug("Collector: No required types identified for caching.")  # Debug
 
         # --- 4. IRenameTargetインスタンスの生成 (2回目のループ) ---
-        for idx, item in enumerate(primary_items):
-            target_cls = target_class_map.get(idx)
-
+        for item, target_cls in zip(primary_items, target_classes):
             if target_cls:
                 try:
                     target_instance = target_cls.create_from_scope(
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from bpy.types import Context, EditBone, FileSelectEntry, Node, Object, PoseBone
 
@@ -25,6 +25,17 @@ class RenameTargetRegistry:
         {}
     )  # IDコードは一意と仮定
 
+    # VIEW3D のアイテムの型 -> bl_type (初回の isinstance 判定の結果を型ごとに保持)
+    _view3d_bl_types: Dict[type, Optional[str]] = {}
+
+    # 1種類のアイテムのみを扱う収集元 -> (アイテムの型, bl_type)
+    # TODO: ノードの種類によって異なるクラスが必要?
+    _item_types_by_source: Dict[CollectionSource, Tuple[type, str]] = {
+        CollectionSource.NODE_EDITOR: (Node, "NODE"),
+        CollectionSource.SEQUENCE_EDITOR: (SequenceType, "STRIP"),
+        CollectionSource.FILE_BROWSER: (FileSelectEntry, "FILE"),
+    }
+
     _instance: Optional["RenameTargetRegistry"] = None
     _target_classes: List[Type[IRenameTarget]] = []
 
@@ -155,70 +166,101 @@ class RenameTargetRegistry:
         self, item: Any, scope: OperationScope
     ) -> Optional[Type[IRenameTarget]]:
         """一次アイテムとスコープから対応するターゲットクラスを見つける"""
+        return self.get_target_class_finder(scope)(item)
+
+    def get_target_class_finder(
+        self, scope: OperationScope
+    ) -> Callable[[Any], Optional[Type[IRenameTarget]]]:
+        """
+        スコープに応じた判定関数を返す
+
+        収集元はスコープごとに決まるため、アイテムごとに収集元を比較しないよう
+        大量のアイテムを判定する場合は一度だけ取得して使い回す
+        """
+        mode = scope.mode
+        if mode == CollectionSource.VIEW3D:
+            return self._find_view3d_target_class
+        if mode == CollectionSource.OUTLINER:
+            return self._find_outliner_target_class
+
+        # 残りの収集元は型と bl_type の対応表で判定する
+        entry = self._item_types_by_source.get(mode)
+        if entry is None:
+            return lambda item: None
+        item_type, bl_type = entry
+        return lambda item: (
+            self._target_classes_by_bl_type.get(bl_type)
+            if isinstance(item, item_type)
+            else None
+        )
 
-        if scope.mode == CollectionSource.VIEW3D:
-            # (isinstance を使うか、より汎用的なマッピングが必要かも)
-            if isinstance(item, Object):
-                return self._target_classes_by_bl_type.get("OBJECT")
-            elif isinstance(item, PoseBone):
-                return self._target_classes_by_bl_type.get("POSE_BONE")
-            elif isinstance(item, EditBone):
-                return self._target_classes_by_bl_type.get("EDIT_BONE")
-
-        elif scope.mode == CollectionSource.OUTLINER:
-            # OUTLINER: OutlinerElementInfo から探す
-            if isinstance(item, OutlinerElementInfo):
-                # 優先度: IDコード > ol_type
-                target_cls = self._target_classes_by_ol_idcode.get(item.idcode)
-                if target_cls:
-                    # IDコードで見つかったら、ol_type も一致するか念のため確認しても良い
-                    if getattr(target_cls, "ol_type", None) == item.type:
-                        return target_cls
-                    else:
-                        # IDコードは一致したがol_typeが異なるレアケース？警告を出すなど
-                        log.warning(
-                            f"警告: IDコード {item.idcode} でクラス {target_cls.__name__} が見つかりましたが、ol_type が一致しません ({item.type})"
-                        )
-                        # fallback to ol_type search? or return None?
-
-                # IDコードで見つからない場合、ol_typeで検索
-                possible_classes = self._target_classes_by_ol_type.get(item.type, [])
-                if len(possible_classes) == 1:
-                    return possible_classes[0]
-                elif len(possible_classes) > 1:
-                    # ol_typeが同じクラスが複数ある場合、さらに絞り込みが必要
-                    # TSE_SOME_IDの場合、idcodeで区別できているはず
-                    # TSE_RNA_STRUCTの場合、parent.store_elem.contents.idで親要素を取得
-                    # このロジックはここに書くか、各クラスのcan_createにするか要検討
+    def _find_view3d_target_class(self, item: Any) -> Optional[Type[IRenameTarget]]:
+        """VIEW3D のアイテムに対応するターゲットクラスを見つける"""
+        # 同じ型のアイテムが大量に渡されるため、判定結果を型ごとにキャッシュする
+        item_type = type(item)
+        try:
+            bl_type = self._view3d_bl_types[item_type]
+        except KeyError:
+            bl_type = self._view3d_bl_types[item_type] = self._guess_view3d_bl_type(
+                item
+            )
+        if bl_type:
+            return self._target_classes_by_bl_type.get(bl_type)
+        return None
 
+    def _find_outliner_target_class(self, item: Any) -> Optional[Type[IRenameTarget]]:
+        """アウトライナーのアイテムに対応するターゲットクラスを見つける"""
+        # OUTLINER: OutlinerElementInfo から探す
+        if isinstance(item, OutlinerElementInfo):
+            # 優先度: IDコード > ol_type
+            target_cls = self._target_classes_by_ol_idcode.get(item.idcode)
+            if target_cls:
+                # IDコードで見つかったら、ol_type も一致するか念のため確認しても良い
+                if getattr(target_cls, "ol_type", None) == item.type:
+                    return target_cls
+                else:
+                    # IDコードは一致したがol_typeが異なるレアケース？警告を出すなど
                     log.warning(
-                        f"警告: ol_type {item.type} に複数の候補クラスが見つかりました: {possible_classes}"
+                        f"警告: IDコード {item.idcode} でクラス {target_cls.__name__} が見つかりましたが、ol_type が一致しません ({item.type})"
                     )
-                    # ここで item の情報 (idcodeなど) を使ってさらに絞り込む
-                    for cls in possible_classes:
-                        ol_idcode = getattr(cls, "ol_idcode", None)
-                        if ol_idcode == item.idcode:
-                            return cls
+                    # fallback to ol_type search? or return None?
+
+            # IDコードで見つからない場合、ol_typeで検索
+            possible_classes = self._target_classes_by_ol_type.get(item.type, [])
+            if len(possible_classes) == 1:
+                return possible_classes[0]
+            elif len(possible_classes) > 1:
+                # ol_typeが同じクラスが複数ある場合、さらに絞り込みが必要
+                # TSE_SOME_IDの場合、idcodeで区別できているはず
+                # TSE_RNA_STRUCTの場合、parent.store_elem.contents.idで親要素を取得
+                # このロジックはここに書くか、各クラスのcan_createにするか要検討
 
                 log.warning(
-                    f"未対応のアイテムです。\nname: {item.name}\ntype: {item.type}\nidcode: {item.idcode}"
+                    f"警告: ol_type {item.type} に複数の候補クラスが見つかりました: {possible_classes}"
                 )
+                # ここで item の情報 (idcodeなど) を使ってさらに絞り込む
+                for cls in possible_classes:
+                    ol_idcode = getattr(cls, "ol_idcode", None)
+                    if ol_idcode == item.idcode:
+                        return cls
 
-        elif scope.mode == CollectionSource.NODE_EDITOR:
-            if isinstance(item, Node):
-                # TODO: ノードの種類によって異なるクラスが必要?
-                return self._target_classes_by_bl_type.get("NODE")
-
-        elif scope.mode == CollectionSource.SEQUENCE_EDITOR:
-            if isinstance(item, SequenceType):
-                return self._target_classes_by_bl_type.get("STRIP")
-
-        elif scope.mode == CollectionSource.FILE_BROWSER:
-            if isinstance(item, FileSelectEntry):
-                return self._target_classes_by_bl_type.get("FILE")
+            log.warning(
+                f"未対応のアイテムです。\nname: {item.name}\ntype: {item.type}\nidcode: {item.idcode}"
+            )
 
         return None  # 見つからない場合
 
+    @staticmethod
+    def _guess_view3d_bl_type(item: Any) -> Optional[str]:
+        """VIEW3D のアイテムに対応する bl_type を判定する"""
+        if isinstance(item, Object):
+            return "OBJECT"
+        elif isinstance(item, PoseBone):
+            return "POSE_BONE"
+        elif isinstance(item, EditBone):
+            return "EDIT_BONE"
+        return None
+
     def create_target_from_source(
         self,
         context: Context,
@@ -3,6 +3,8 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
+import os
+
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
@@ -14,20 +16,27 @@ release = "0.1"
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
+# DOCS_FAST=1 で図の生成など重い拡張を読み込まず、高速にビルドする
+DOCS_FAST = os.environ.get("DOCS_FAST") == "1"
+
 extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.napoleon",  # Google/Numpy形式のDocstring対応
     "sphinx.ext.viewcode",  # ソースコード表示
     "sphinx.ext.intersphinx",  # 外部ドキュメントへのリンク
-    "sphinx.ext.inheritance_diagram",  # 継承関係の図
-    "sphinx.ext.graphviz",  # クラス図
-    "sphinx_automodapi.automodapi",  # モジュールのAPIドキュメント
-    "sphinxcontrib.mermaid",  # マーメイド図
     "myst_parser",
     "sphinx_design",
     "sphinx_copybutton",
 ]
 
+if not DOCS_FAST:
+    extensions += [
+        "sphinx.ext.inheritance_diagram",  # 継承関係の図
+        "sphinx.ext.graphviz",  # クラス図
+        "sphinx_automodapi.automodapi",  # モジュールのAPIドキュメント
+        "sphinxcontrib.mermaid",  # マーメイド図
+    ]
+
 autodoc_mock_imports = ["bpy", "mathutils"]
 
 inheritance_graph_attrs = dict(rankdir="TB", size='"6.0, 8.0"')
@@ -1,4 +1,5 @@
-import random
+import functools
+import string
 from typing import Optional, Tuple
 
 from ..core.contracts.counter import BaseCounter
@@ -7,15 +8,37 @@ from ..utils import logging, regex_utils
 
 log = logging.get_logger(__name__)
 
+# よく使われる1〜2文字 (1->A ... 702->ZZ) は事前に生成しておく (インデックス = 値 - 1)
+_UPPER_LETTERS = [*string.ascii_uppercase] + [
+    a + b for a in string.ascii_uppercase for b in string.ascii_uppercase
+]
+_LOWER_LETTERS = [*string.ascii_lowercase] + [
+    a + b for a in string.ascii_lowercase for b in string.ascii_lowercase
+]
+# 逆引き (A->1 ... ZZ->702)。1文字のエントリは各桁の値としても使う
+_UPPER_VALUES = {s: i for i, s in enumerate(_UPPER_LETTERS, 1)}
+_LOWER_VALUES = {s: i for i, s in enumerate(_LOWER_LETTERS, 1)}
+
+
+@functools.lru_cache(maxsize=None)
+def zero_padded_table(padding: int) -> Tuple[str, ...]:
+    """よく使われる 0〜999 のゼロ埋め文字列 (インデックス = 値)"""
+    return tuple(str(i).zfill(padding) for i in range(min(10**padding, 1000)))
+
 
 class NumericCounter(BaseCounter):
     """Simple numeric counter with configurable digits"""
 
+    __slots__ = ("padding", "_max_value", "_padded")
+
     element_type = "numeric_counter"  # INameElementインターフェースの要件を満たすため
 
     def __init__(self, element_config):
         super().__init__(element_config)
         self.padding = getattr(element_config, "padding", 2)
+        # 値の生成・整形のたびに計算しないよう事前に求めておく
+        self._max_value = 10**self.padding
+        self._padded = zero_padded_table(self.padding)
 
     config_fields = {
         **BaseCounter.config_fields,
@@ -30,29 +53,34 @@ class NumericCounter(BaseCounter):
             return "padding は1から10の整数である必要があります"
         return None
 
+    def _pattern_key(self) -> Tuple:
+        return (*super()._pattern_key(), self.padding)
+
     @regex_utils.add_separator_by_order
     @regex_utils.add_named_capture_group
     def _build_pattern(self) -> str:
         """Build regex pattern for numeric counter"""
-        return f"\\d{{{self.padding}}}"
+        # \d はUnicodeの数字全般にマッチするため、ASCIIの数字に限定する
+        return f"[0-9]{{{self.padding}}}"
 
     def format_value(self, value: int) -> str:
         """Format integer value as zero-padded string"""
-        return f"{value:0{self.padding}d}"
-
-    def gen_proposed_name(self, value: int) -> str:
-        """Generate proposed name with given counter value"""
-        return f"{self.forward}{self.format_value(value)}{self.backward}"
+        if 0 <= value < len(self._padded):
+            return self._padded[value]
+        # format(value, "0Nd") と同じ結果で、書式指定の解析が不要な分速い
+        return str(value).zfill(self.padding)
 
     def generate_random_value(self) -> Tuple[str, str]:
         """Generate random value for numeric counter"""
-        random_value = f"{random.randint(0, 10**self.padding):0{self.padding}d}"
+        random_value = self.format_value(self._rng.randrange(self._max_value))
         return self.separator, random_value
 
 
 class BlenderCounter(BaseCounter):
     """Blender's native counter (.001 format)"""
 
+    __slots__ = ("padding", "_padded", "_width")
+
     element_type = "blender_counter"
 
     def __init__(self, element_config):
@@ -61,7 +89,12 @@ class BlenderCounter(BaseCounter):
         self._order = 1000  # 絶対に最後にマッチするようにする
         self._enabled = False
         self._separator = "."
+        self._escaped_separator = r"\."
         self.padding = 3
+        # 3桁固定なので 000〜999 の全ての値がテーブルに収まる
+        self._padded = zero_padded_table(self.padding)
+        # 末尾の ".001" の長さ。解析はターゲットごとに行われるため事前に求めておく
+        self._width = self.padding + 1
 
     config_fields = {
         **BaseCounter.config_fields,
@@ -72,27 +105,51 @@ class BlenderCounter(BaseCounter):
     def validate_config(cls, config: ElementConfig) -> Optional[str]:
         return None  # BlenderCounterはバリデーションを行わない
 
+    def _pattern_key(self) -> Tuple:
+        return (*super()._pattern_key(), self.padding)
+
     @regex_utils.add_named_capture_group
     def _build_pattern(self) -> str:
         """Build regex pattern for Blender counter"""
-        return f"\\{self._separator}\\d{{{self.padding}}}$"  # ".1000"以降は考慮しない
-
-    def _parse_value(self, value_str: str) -> int:
+        return f"{self.escaped_separator}[0-9]{{{self.padding}}}$"  # ".1000"以降は考慮しない
+
+    def parse(self, name: str) -> bool:
+        """Parse Blender counter from the end of name without the regex engine"""
+        # 末尾固定長の ".001" 形式なので、正規表現を使わずに判定する
+        width = self._width
+        tail = name[-width:]
+        digits = tail[1:]
+        if (
+            len(tail) == width
+            and tail[0] == self._separator
+            and digits.isascii()
+            and digits.isdigit()
+        ):
+            self._value = tail
+            self._value_int = int(digits)
+            self.forward = name[:-width]
+            self.backward = ""
+            return True
+        return False
+
+    def _parse_value(self, value_str: str) -> int | None:
         """Parse Blender counter value (.001 -> 1)"""
         # セパレータードット除去して数値化
-        return int(value_str[1:])
+        digits = value_str[1:]
+        if digits.isascii() and digits.isdigit():
+            return int(digits)
+        return None
 
     def format_value(self, value: int) -> str:
         """Format integer as Blender counter (.001)"""
-        return f"{self._separator}{value:0{self.padding}d}"
-
-    def gen_proposed_name(self, value: int) -> str:
-        """Generate proposed name with Blender counter"""
-        return f"{self.forward}{self.format_value(value)}"
+        if 0 <= value < len(self._padded):
+            return self._separator + self._padded[value]
+        return self._separator + str(value).zfill(self.padding)
 
     def generate_random_value(self) -> Tuple[str, str]:
         """Generate random value for Blender counter"""
-        random_value = f"{random.randint(0, 10**self.padding):0{self.padding}d}"
+        # テーブルから選ぶため、桁数を超える値は生成されない
+        random_value = self._rng.choice(self._padded)
         return self.separator, random_value
 
 
@@ -102,16 +159,23 @@ blender_counter_element_config = ElementConfig(
     order=1000,
     enabled=False,
     separator=".",
-    digits=3,
+    padding=3,
 )
 
 
 class AlphabeticCounter(BaseCounter):
     """Alphabetic counter (A, B, C... AA, AB...)"""
 
+    __slots__ = ("uppercase", "max_length", "_letters", "_values")
+
     def __init__(self, element_config):
         super().__init__(element_config)
         self.uppercase = element_config.get("uppercase", True)
+        # 量指定子に上限を設け、他の要素と組み合わせた際のバックトラックを抑える
+        self.max_length = getattr(element_config, "max_length", 8)
+        # 大文字・小文字の変換テーブルは生成時に決まるため、呼び出しごとに選ばない
+        self._letters = _UPPER_LETTERS if self.uppercase else _LOWER_LETTERS
+        self._values = _UPPER_VALUES if self.uppercase else _LOWER_VALUES
 
     config_fields = {
         **BaseCounter.config_fields,
@@ -126,19 +190,29 @@ class AlphabeticCounter(BaseCounter):
             return "uppercase は True または False である必要があります"
         return None
 
+    def _pattern_key(self) -> Tuple:
+        return (*super()._pattern_key(), self.uppercase, self.max_length)
+
     @regex_utils.add_separator_by_order
     @regex_utils.add_named_capture_group
     def _build_pattern(self) -> str:
         """Build regex for alphabetic counter"""
-        pattern = r"[A-Z]+" if self.uppercase else r"[a-z]+"
-        return f"{pattern}"
+        letters = "[A-Z]" if self.uppercase else "[a-z]"
+        return f"{letters}{{1,{self.max_length}}}"
 
-    def _parse_value(self, value_str: str) -> int:
+    def _parse_value(self, value_str: str) -> int | None:
         """Convert alphabetic value to integer (A->1, B->2...)"""
+        values = self._values
+        value = values.get(value_str)
+        if value is not None:
+            return value
+
         result = 0
         for char in value_str:
-            base_char = "A" if self.uppercase else "a"
-            result = result * 26 + (ord(char) - ord(base_char) + 1)
+            value = values.get(char)
+            if value is None:
+                return None
+            result = result * 26 + value
         return result
 
     def format_value(self, value: int) -> str:
@@ -146,20 +220,21 @@ class AlphabeticCounter(BaseCounter):
         if value <= 0:
             return ""
 
-        result = ""
-        base_char = ord("A") if self.uppercase else ord("a")
+        letters = self._letters
+        if value <= len(letters):
+            return letters[value - 1]
 
-        while value > 0:
+        # 下位の桁から求まるため、最後に反転して結合する
+        # 上位の2文字分はテーブルから取り出す
+        chars = []
+        while value > len(letters):
             value, remainder = divmod(value - 1, 26)
-            result = chr(base_char + remainder) + result
-
-        return result
+            chars.append(letters[remainder])
+        chars.append(letters[value - 1])
 
-    def gen_proposed_name(self, value: int) -> str:
-        """Generate proposed name with alphabetic counter"""
-        return f"{self.forward}{self.format_value(value)}{self.backward}"
+        return "".join(reversed(chars))
 
     def generate_random_value(self) -> Tuple[str, str]:
         """Generate random value for alphabetic counter"""
-        random_value = random.randint(1, 26)
+        random_value = self._rng.randrange(1, 27)
         return self.separator, self.format_value(random_value)
@@ -1,13 +1,15 @@
-import random
-import re
-from typing import Optional
+from typing import Optional, Tuple
 
 from ..core.constants import POSITION_ENUM_ITEMS
 from ..core.contracts.element import BaseElement, ElementConfig
-from ..utils import logging
+from ..utils import logging, regex_utils
 
 log = logging.get_logger(__name__)
 
+# Y軸・Z軸の値は固定なので、要素の生成ごとに分割しないよう事前に求めておく
+_YAXIS_VALUES: Tuple[str, ...] = tuple(POSITION_ENUM_ITEMS["YAXIS"][0][0].split("|"))
+_ZAXIS_VALUES: Tuple[str, ...] = tuple(POSITION_ENUM_ITEMS["ZAXIS"][0][0].split("|"))
+
 
 class PositionElement(BaseElement):
     """
@@ -26,24 +28,23 @@ class PositionElement(BaseElement):
 
         # Y軸の値を取得
         self.yaxis_enabled = element_config.yaxis_enabled
-        self.yaxis_values = (
-            POSITION_ENUM_ITEMS["YAXIS"][0][0].split("|") if self.yaxis_enabled else []
-        )
+        self.yaxis_values = _YAXIS_VALUES if self.yaxis_enabled else ()
 
         # Z軸の値を取得
         self.zaxis_enabled = element_config.zaxis_enabled
-        self.zaxis_values = (
-            POSITION_ENUM_ITEMS["ZAXIS"][0][0].split("|") if self.zaxis_enabled else []
-        )
+        self.zaxis_values = _ZAXIS_VALUES if self.zaxis_enabled else ()
 
         # すべての可能な位置値を組み合わせる
-        self.position_values = []
-        if self.xaxis_enabled and self.xaxis_values:
-            self.position_values.extend(self.xaxis_values)
-        if self.yaxis_enabled and self.yaxis_values:
-            self.position_values.extend(self.yaxis_values)
-        if self.zaxis_enabled and self.zaxis_values:
-            self.position_values.extend(self.zaxis_values)
+        # 軸の設定は生成時に固定されるため、組み合わせ済みのタプルとして保持する
+        self.position_values: Tuple[str, ...] = (
+            *self.xaxis_values,
+            *self.yaxis_values,
+            *self.zaxis_values,
+        )
+        # 全ての値が同じ長さなら、正規表現を使わずに切り出しと集合の照合で解析できる
+        self._value_set = frozenset(self.position_values)
+        lengths = {len(value) for value in self.position_values}
+        self._fixed_len = lengths.pop() if len(lengths) == 1 else None
 
     config_fields = {
         **BaseElement.config_fields,
@@ -69,8 +70,7 @@ class PositionElement(BaseElement):
             return "(?!.)"
 
         # 位置値をエスケープして正規表現パターンを構築
-        escaped_positions = [re.escape(pos) for pos in self.position_values]
-        positions_pattern = "|".join(escaped_positions)
+        positions_pattern = regex_utils.build_alternation(self.position_values)
 
         # 値のみをキャプチャする名前付きグループ
         value_capture = f"(?P<{self.id}>{positions_pattern})"
@@ -83,30 +83,42 @@ class PositionElement(BaseElement):
         else:
             # 2番目以降の要素: 先行するセパレータ + 値
             # セパレータは non-capturing group (?:...) にして、位置の値だけをキャプチャ
-            sep = re.escape(self.separator)
+            sep = self.escaped_separator
             # セパレータがオプショナルでないことに注意 (前の要素がある前提のため)
             return f"(?:{sep}){value_capture}"
 
+    def parse(self, name: str) -> bool:
+        """
+        値が固定長の場合はセパレーターの位置から切り出して照合する。
+        正規表現の search と同じく、最も左で一致する値を採用する。
+        """
+        separator = self.separator
+        if self._fixed_len is None or self.order == 0 or not separator:
+            return super().parse(name)
+
+        width = self._fixed_len
+        start = name.find(separator)
+        while start != -1:
+            begin = start + len(separator)
+            candidate = name[begin : begin + width]
+            if candidate in self._value_set:
+                self._value = candidate
+                return True
+            start = name.find(separator, start + 1)
+        return False
+
     def generate_random_value(self):
         """Generate a random position value"""
         if self.position_values:
-            return random.choice(self.position_values)
+            return self._rng.choice(self.position_values)
         return "L"  # デフォルト値
 
     def get_value_by_idx(self, index: int) -> Optional[str]:
         """指定されたインデックスに対応する位置の値を取得する"""
-        # get_value_by_idx が呼ばれるのはUIからで、その時点での有効な軸の値リストが必要
-        combined_values = []
-        if self.xaxis_enabled and self.xaxis_values:
-            combined_values.extend(self.xaxis_values)
-        if self.yaxis_enabled and self.yaxis_values:
-            combined_values.extend(self.yaxis_values)
-        if self.zaxis_enabled and self.zaxis_values:
-            combined_values.extend(self.zaxis_values)
-
-        if 0 <= index < len(combined_values):
-            return combined_values[index]
+        # get_value_by_idx が呼ばれるのはUIからで、有効な軸の値は position_values と同じ
+        if 0 <= index < len(self.position_values):
+            return self.position_values[index]
         log.warning(
-            f"Index {index} is out of range for position values: {combined_values}"
+            f"Index {index} is out of range for position values: {self.position_values}"
         )
         return None
@@ -1,6 +1,4 @@
-import random
-import re
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 
 from ..core.contracts.element import BaseElement, ElementConfig
 from ..utils import logging, regex_utils
@@ -22,6 +20,16 @@ class TextElement(BaseElement):
         "items": list,
     }
 
+    @property
+    def items(self) -> Tuple[str, ...]:
+        return self._items
+
+    @items.setter
+    def items(self, items: Iterable[str]) -> None:
+        # 不変のタプルで保持し、そのままパターン構築のキャッシュキーとして使う
+        self._items = tuple(items)
+        self.invalidate_cache()
+
     @classmethod
     def validate_config(cls, config: ElementConfig) -> Optional[str]:
         if error := super().validate_config(config):
@@ -38,13 +46,12 @@ class TextElement(BaseElement):
         if not self.items:
             return ""
 
-        escaped_items = [re.escape(item) for item in self.items]
-        return "|".join(escaped_items)
+        return regex_utils.build_alternation(self.items)
 
     def generate_random_value(self) -> str:
         """Generate a random value from the available items"""
         if self.items:
-            return random.choice(self.items)
+            return self._rng.choice(self.items)
         return ""
 
 
@@ -1,7 +1,11 @@
 # pyright: reportInvalidTypeForm=false
 # DEPENDS_ON = ["props"]
 import json
-from typing import List, Optional
+import logging
+import os
+import tempfile
+import textwrap
+from typing import Dict, List, Optional, Set, Tuple
 
 import bpy
 from bpy.types import AddonPreferences
@@ -24,24 +28,172 @@ from .utils.logging import get_logger, LoggerPreferences
 
 log = get_logger(__name__)
 
+# 列挙値の番号は Blender に自動で割り当てさせる (保存済みの設定との互換性のため)
+_XAXIS_ENUM_ITEMS = tuple(item[:3] for item in POSITION_ENUM_ITEMS["XAXIS"])
+
+
+# --------------------- Import / Export ---------------------
+# 要素タイプごとの固有プロパティの書き出し・読み込み
+# タイプごとの分岐を要素ごとに辿らないよう、対応表で引く
+
+
+def _set_if_changed(element, key: str, value) -> None:
+    """値が変わる場合のみ代入する（更新コールバックの無駄な発火を避ける）"""
+    if getattr(element, key) != value:
+        setattr(element, key, value)
+
+
+def _export_text(element) -> dict:
+    return {"items": [item.name for item in element.items]}
+
+
+def _export_numeric_counter(element) -> dict:
+    return {"padding": element.padding}
+
+
+def _export_position(element) -> dict:
+    # PositionElement の設定を正しくエクスポート
+    return {
+        "xaxis_type": element.xaxis_type,
+        "xaxis_enabled": element.xaxis_enabled,
+        "yaxis_enabled": element.yaxis_enabled,
+        "zaxis_enabled": element.zaxis_enabled,
+    }
+
+
+# パス -> ((更新時刻, サイズ), 解析済みのデータ)
+# 変更されていないファイルを再インポートする場合は、読み込みと解析を省く
+_import_cache: Dict[str, Tuple[Tuple[int, int], list]] = {}
+
+
+def _load_pattern_file(filepath: str) -> list:
+    """パターンファイルを読み込む。前回から変更が無ければ解析済みのデータを返す"""
+    st = os.stat(filepath)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _import_cache.get(filepath)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(filepath, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    _import_cache[filepath] = (key, data)
+    return data
+
+
+def _set_item_names(element, names: List[str]) -> None:
+    """テキスト要素の項目を names で置き換える"""
+    # 文字列プロパティは foreach_set で一括設定できないため、
+    # 項目の確保をまとめて行ってから名前を設定する
+    items = element.items
+    items.clear()  # Clear default items if any
+    for _ in names:
+        items.add()
+    for item, name in zip(items, names):
+        item.name = name
+
+
+def _import_text(element, element_config: dict) -> None:
+    if "items" not in element_config:
+        return
+    _set_item_names(element, element_config.get("items", []))
+
+
+def _import_numeric_counter(element, element_config: dict) -> None:
+    if "padding" not in element_config:
+        return
+    # Make sure padding has a valid value
+    padding_val = element_config.get("padding", 2)
+    # Clamp between 1 and 10
+    _set_if_changed(element, "padding", max(1, min(int(padding_val), 10)))
+
+
+def _import_position(element, element_config: dict) -> None:
+    _set_if_changed(element, "xaxis_type", element_config.get("xaxis_type", "L|R"))
+    _set_if_changed(element, "xaxis_enabled", element_config.get("xaxis_enabled", True))
+    _set_if_changed(
+        element, "yaxis_enabled", element_config.get("yaxis_enabled", False)
+    )
+    _set_if_changed(
+        element, "zaxis_enabled", element_config.get("zaxis_enabled", False)
+    )
+
+
+# regex: pattern / date: date_format / free_text: default_text は未対応
+_EXPORT_EXTRA = {
+    "text": _export_text,
+    "numeric_counter": _export_numeric_counter,
+    "position": _export_position,
+}
+
+_IMPORT_APPLY = {
+    "text": _import_text,
+    "numeric_counter": _import_numeric_counter,
+    "position": _import_position,
+}
+
+
+# 変更されたパターンのID (編集モードの終了時に同期するパターンの候補)
+# None の場合は未確定で、保存されている modified フラグを走査して求める
+_dirty_pattern_ids: Optional[Set[str]] = None
+
+
+# パターンを一括で作成する間 (インポートなど) は更新コールバックによる変更の記録を行わない
+# (作成したパターンは add_pattern で変更済みとして記録される)
+_suppress_modified_updates = False
+
+
+def _mark_pattern_dirty(pattern_id: str) -> None:
+    if _dirty_pattern_ids is not None:
+        _dirty_pattern_ids.add(pattern_id)
+
+
+# パターンID -> {要素ID: コレクション内のインデックス}
+# PropertyGroup のPythonオブジェクトはアクセスのたびに作られるため、パターンIDをキーにする
+_element_index_cache: Dict[str, Dict[str, int]] = {}
+
+
+def _discard_synchronized_patterns(patterns) -> None:
+    """同期が済んだ (modified が解除された) パターンを候補から外す"""
+    if _dirty_pattern_ids is None:
+        return
+    for pattern in patterns:
+        if not pattern.modified:
+            _dirty_pattern_ids.discard(pattern.id)
+
 
 # FIXME: リロードの問題が解決しないため、Prefsにて定義
 # ----------------------- Props -----------------------
 class ModifiedPropMixin:
     def _update_modified(self):
         """自分と親のmodifiedフラグをTrueに"""
-        log.debug(f"Updating modified for {self}")  # 呼ばれてる でもnameはない
-        if hasattr(self, "modified"):
-            log.debug(f"self.modified: {self.modified}")
-            self.modified = True
-        parent = getattr(self, "id_data", None)
-        if parent and hasattr(parent, "_update_modified"):
-            log.debug(f"parent: {parent}")  # FIXME: 呼ばれて無さそう
-            parent._update_modified()
+        if _suppress_modified_updates:
+            return
+        # 入力のたびに呼ばれるため、hasattr (例外による判定) を使わずクラスから引く
+        debug = log.is_enabled_for(logging.DEBUG)
+        if debug:
+            log.debug(f"Updating modified for {self}")  # 呼ばれてる でもnameはない
+        mark_modified = getattr(type(self), "mark_modified", None)
+        if mark_modified is not None:
+            modified = self.modified
+            if debug:
+                log.debug(f"self.modified: {modified}")
+            # 既に変更済みであれば、同期対象としての記録も親への伝播も済んでいる
+            if modified:
+                return
+            mark_modified(self)
+        parent = self.id_data
+        if parent is None:
+            return
+        update_parent = getattr(type(parent), "_update_modified", None)
+        if update_parent is not None:
+            if debug:
+                log.debug(f"parent: {parent}")  # FIXME: 呼ばれて無さそう
+            update_parent(parent)
 
 
-def modified_updater():
-    return lambda self, context: self._update_modified()
+def _modified_update(self, context):
+    """modified フラグを更新するプロパティの update コールバック (全プロパティで共有)"""
+    self._update_modified()
 
 
 class NamingElementItemProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
@@ -51,7 +203,7 @@ class NamingElementItemProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
         name="Name",
         description="Name of this item",
         default="",
-        update=modified_updater(),
+        update=_modified_update,
     )
 
 
@@ -66,7 +218,7 @@ class NamingElementProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
         name="Display Name",
         description="User-friendly name for this element",
         default="",
-        update=modified_updater(),
+        update=_modified_update,
     )
 
     element_type: EnumProperty(
@@ -74,14 +226,14 @@ class NamingElementProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
         description="Type of this naming element",
         items=ELEMENT_TYPE_ITEMS,
         default="text",
-        update=modified_updater(),
+        update=_modified_update,
     )
 
     enabled: BoolProperty(
         name="Enabled",
         description="Whether this element is active",
         default=True,
-        update=modified_updater(),
+        update=_modified_update,
     )
 
     order: IntProperty(
@@ -89,7 +241,7 @@ class NamingElementProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
         description="Position in the naming sequence",
         default=0,
         min=0,
-        update=modified_updater(),
+        update=_modified_update,
     )
 
     # For all elements - separator selection
@@ -99,7 +251,7 @@ class NamingElementProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
         items=SEPARATOR_ITEMS,
         default="_",
         translation_context=i18n_contexts.operator_default,
-        update=modified_updater(),
+        update=_modified_update,
     )
 
     # For text elements - predefined options
@@ -111,7 +263,7 @@ class NamingElementProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
 
     # For text elements - active item index
     active_item_index: IntProperty(
-        name="Active Item Index", default=0, update=modified_updater()
+        name="Active Item Index", default=0, update=_modified_update
     )
 
     def get_item_by_idx(self, idx: int) -> Optional[NamingElementItemProperty]:
@@ -126,7 +278,7 @@ class NamingElementProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
         default=2,
         min=1,
         max=10,
-        update=modified_updater(),
+        update=_modified_update,
     )
 
     # # For regex elements
@@ -134,7 +286,7 @@ class NamingElementProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
     #     name="Pattern",
     #     description="Regular expression pattern for matching",
     #     default="(.*)",
-    #     update=modified_updater(),
+    #     update=_modified_update,
     # )
 
     # # For date elements
@@ -142,7 +294,7 @@ class NamingElementProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
     #     name="Format",
     #     description="Date format string (strftime)",
     #     default="%Y%m%d",
-    #     update=modified_updater(),
+    #     update=_modified_update,
     # )
 
     # # For free text
@@ -150,37 +302,37 @@ class NamingElementProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
     #     name="Default Text",
     #     description="Default text to use",
     #     default="",
-    #     update=modified_updater(),
+    #     update=_modified_update,
     # )
 
     # For position elements
     xaxis_type: EnumProperty(
         name="X Axis Type",
         description="Type of X-axis position indicator",
-        items=[(item[0], item[1], item[2]) for item in POSITION_ENUM_ITEMS["XAXIS"]],
+        items=_XAXIS_ENUM_ITEMS,
         default="L|R",
-        update=modified_updater(),
+        update=_modified_update,
     )
 
     xaxis_enabled: BoolProperty(
         name="X Axis Enabled",
         description="Whether X-axis position is enabled",
         default=True,
-        update=modified_updater(),
+        update=_modified_update,
     )
 
     yaxis_enabled: BoolProperty(
         name="Y Axis Enabled",
         description="Whether Y-axis position is enabled",
         default=False,
-        update=modified_updater(),
+        update=_modified_update,
     )
 
     zaxis_enabled: BoolProperty(
         name="Z Axis Enabled",
         description="Whether Z-axis position is enabled",
         default=False,
-        update=modified_updater(),
+        update=_modified_update,
     )
 
 
@@ -195,7 +347,7 @@ class NamingPatternProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
         name="Name",
         description="User-friendly name for this pattern",
         default="",
-        update=modified_updater(),
+        update=_modified_update,
     )
 
     elements: CollectionProperty(
@@ -212,17 +364,39 @@ class NamingPatternProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
 
     active_element_index: IntProperty(name="Active Element Index", default=0)
 
+    def mark_modified(self):
+        """変更済みにし、編集モードの終了時に同期されるよう記録する"""
+        # 入力のたびに呼ばれるため、既に変更済みであればRNAへの書き込みを省く
+        if not self.modified:
+            self.modified = True
+        _mark_pattern_dirty(self.id)
+
     def get_element_by_id(self, id: str) -> Optional[NamingElementProperty]:
-        if not self.elements:
+        elements = self.elements
+        if not elements:
             return None
-        for elem in self.elements:
-            if elem.id == id:
-                return elem
-        return None
+
+        # 描画のたびに呼ばれるため、要素の位置を記録しておき走査を省く
+        indices = _element_index_cache.get(self.id)
+        if indices is not None:
+            index = indices.get(id)
+            # 要素の追加・削除・移動以外で並びが変わった場合に備えて、取り出した要素を確認する
+            if index is not None and index < len(elements):
+                elem = elements[index]
+                if elem.id == id:
+                    return elem
+
+        # 記録が無いか古い場合は作り直す (同じIDの要素は先頭のものを返す)
+        indices = _element_index_cache[self.id] = {}
+        for index, elem in enumerate(elements):
+            indices.setdefault(elem.id, index)
+        index = indices.get(id)
+        return elements[index] if index is not None else None
 
     # Add or remove an element
     def add_element(self, id, element_type, display_name):
-        self.modified = True
+        self.mark_modified()
+        _element_index_cache.pop(self.id, None)
         elem = self.elements.add()
         elem.id = id
         elem.element_type = element_type
@@ -231,50 +405,47 @@ class NamingPatternProperty(bpy.types.PropertyGroup, ModifiedPropMixin):
         return elem
 
     def remove_element(self, index):
-        self.modified = True
+        self.mark_modified()
+        _element_index_cache.pop(self.id, None)
         if 0 <= index < len(self.elements):
-            removed_order = self.elements[index].order
+            # 要素の順序はコレクション内の位置で決まるため、残りの順序値は書き換えない
             self.elements.remove(index)
 
-            # 削除されたエレメントよりも高い順序値を持つエレメントの順序を調整
-            for elem in self.elements:
-                if elem.order > removed_order:
-                    elem.order -= 1
-
     def move_element_up(self, index):
         """エレメントを上に移動（順序を前に）"""
-        self.modified = True
+        self.mark_modified()
+        _element_index_cache.pop(self.id, None)
         if 0 < index < len(self.elements):
-            # 現在のエレメントと1つ前のエレメントの順序値を取得
-            current_elem = self.elements[index]
-            prev_elem = self.elements[index - 1]
-
-            # 順序値を交換
-            temp_order = current_elem.order
-            current_elem.order = prev_elem.order
-            prev_elem.order = temp_order
-
-            # UIリストの表示順序に反映するために、コレクション内の要素も交換
+            # コレクション内の位置が順序になるため、要素を交換するだけでよい
             self.elements.move(index, index - 1)
             self.active_element_index = index - 1
 
     def move_element_down(self, index):
         """エレメントを下に移動（順序を後ろに）"""
-        self.modified = True
+        self.mark_modified()
+        _element_index_cache.pop(self.id, None)
         if 0 <= index < len(self.elements) - 1:
-            # 現在のエレメントと1つ後のエレメントの順序値を取得
-            current_elem = self.elements[index]
-            next_elem = self.elements[index + 1]
-
-            # 順序値を交換
-            temp_order = current_elem.order
-            current_elem.order = next_elem.order
-            next_elem.order = temp_order
-
-            # UIリストの表示順序に反映するために、コレクション内の要素も交換
+            # コレクション内の位置が順序になるため、要素を交換するだけでよい
             self.elements.move(index, index + 1)
             self.active_element_index = index + 1
 
+    def sort_elements_by_order(self):
+        """コレクション内の要素を順序値の順に並べ替える
+
+        要素の順序はコレクション内の位置を正とし、順序値は追加・削除・移動で更新しない。
+        順序値を外部から設定した場合 (インポートなど) に、その並びを位置に反映するために呼ぶ
+        """
+        orders = [elem.order for elem in self.elements]
+        sorted_indices = sorted(range(len(orders)), key=orders.__getitem__)
+        # 各位置にある要素の元のインデックス (move による並べ替えを追跡する)
+        current = list(range(len(orders)))
+        for position, original_index in enumerate(sorted_indices):
+            index = current.index(original_index, position)
+            if index != position:
+                self.elements.move(index, position)
+                current.insert(position, current.pop(index))
+        _element_index_cache.pop(self.id, None)
+
 
 # ----------------------- End Props -----------------------
 
@@ -299,8 +470,10 @@ def update_edit_mode(self, context):
             if not modified_patterns:
                 return
 
+            # 変更されたパターンのみを作り直す (同期後は modified が解除される)
             pf = PatternFacade(context)
-            pf.synchronize_patterns()
+            pf.synchronize_patterns(modified_patterns)
+            _discard_synchronized_patterns(modified_patterns)
 
         except Exception as e:
             log.error(f"パターンの同期中にエラーが発生しました: {e}")
@@ -329,28 +502,46 @@ class ModularRenamerPreferences(AddonPreferences):
     )
 
     def get_modified_patterns(self) -> List[NamingPatternProperty]:
-        return [pattern for pattern in self.patterns if pattern.modified]
+        global _dirty_pattern_ids
+        if _dirty_pattern_ids is None:
+            # 起動直後は保存されているフラグから求め、以降は変更時に記録したIDを使う
+            modified = [pattern for pattern in self.patterns if pattern.modified]
+            _dirty_pattern_ids = {pattern.id for pattern in modified}
+            return modified
+        if not _dirty_pattern_ids:
+            return []
+        # 記録したIDは同期の失敗などで古くなりうるため、フラグも確認する
+        return [
+            pattern
+            for pattern in self.patterns
+            if pattern.id in _dirty_pattern_ids and pattern.modified
+        ]
 
     # Currently selected pattern
     active_pattern_index: IntProperty(name="Active Pattern", default=0)
 
     def get_active_pattern(self) -> Optional[NamingPatternProperty]:
+        # 描画のたびに呼ばれるため、RNAへのアクセスはそれぞれ1度にまとめる
+        patterns = self.patterns
+        count = len(patterns)
+        if count == 0:
+            return None
+
         # アクティブインデックスが範囲内か確認
-        if not self.patterns or not (
-            0 <= self.active_pattern_index < len(self.patterns)
-        ):
-            # 範囲外なら最初のパターンを選択（またはNone）
-            if self.patterns:
-                self.active_pattern_index = 0
-                return self.patterns[0]
-            else:
-                return None
-        return self.patterns[self.active_pattern_index]
+        index = self.active_pattern_index
+        if 0 <= index < count:
+            return patterns[index]
+
+        # 範囲外なら最初のパターンを選択
+        self.active_pattern_index = 0
+        return patterns[0]
 
     def add_pattern(self, id, name):
         pattern = self.patterns.add()
         pattern.id = id
         pattern.name = name
+        # 新しいパターンは modified が既定で True のため、同期の候補に加える
+        _mark_pattern_dirty(pattern.id)
         return pattern
 
     def remove_pattern(self, index):
@@ -360,9 +551,8 @@ class ModularRenamerPreferences(AddonPreferences):
                 self.active_pattern_index = max(0, self.active_pattern_index - 1)
             self.patterns.remove(index)
 
-    # Export patterns to JSON
-    def export_patterns(self, filepath):
-        data = []
+    def _iter_pattern_dicts(self):
+        """書き出し用にパターンを1つずつ辞書に変換する"""
         for pattern in self.patterns:
             pattern_data = {
                 "id": pattern.id,
@@ -370,52 +560,85 @@ class ModularRenamerPreferences(AddonPreferences):
                 "elements": [],
             }
 
-            for element in pattern.elements:
+            # 順序はコレクション内の位置で決まる
+            for order, element in enumerate(pattern.elements):
                 element_config = {
                     "id": element.id,
                     "display_name": element.display_name,
                     "type": element.element_type,
                     "enabled": element.enabled,
-                    "order": element.order,
+                    "order": order,
                     "separator": element.separator,
                 }
 
                 # Add type-specific properties
-                if element.element_type == "text":
-                    element_config["items"] = [item.name for item in element.items]
-                elif element.element_type == "numeric_counter":
-                    element_config["padding"] = element.padding
-                # elif element.element_type == "regex":
-                #     element_config["pattern"] = element.pattern
-                # elif element.element_type == "date":
-                #     element_config["date_format"] = element.date_format
-                # elif element.element_type == "free_text":
-                #     element_config["default_text"] = element.default_text
-                elif element.element_type == "position":
-                    # PositionElement の設定を正しくエクスポート
-                    element_config["xaxis_type"] = element.xaxis_type
-                    element_config["xaxis_enabled"] = element.xaxis_enabled
-                    element_config["yaxis_enabled"] = element.yaxis_enabled
-                    element_config["zaxis_enabled"] = element.zaxis_enabled
+                export_extra = _EXPORT_EXTRA.get(element.element_type)
+                if export_extra:
+                    element_config.update(export_extra(element))
 
                 pattern_data["elements"].append(element_config)
 
-            data.append(pattern_data)
+            yield pattern_data
 
+    # Export patterns to JSON
+    def export_patterns(self, filepath, compact=False):
+        """パターンをJSONファイルに書き出す
+
+        Args:
+            filepath: 書き出し先のパス
+            compact: 改行やインデントを省いた小さなJSONにするか。
+                人が編集しないファイル向けで、読み込みは通常の形式と同じく行える
+        """
+        # 書き出したファイルは内容が変わるため、解析済みのデータを破棄する
+        _import_cache.pop(filepath, None)
+        tmp_path = None
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            # 全パターンのリストを作らず、パターンごとに書き出す
+            # 出力は json.dump(data, f, indent=4) (compact の場合は区切りの空白なし) と同じ形式になる
+            # 途中で失敗しても既存のファイルを壊さないよう、同じディレクトリの
+            # 一時ファイルに書き出してから置き換える
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=os.path.dirname(os.path.abspath(filepath)),
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_path = f.name
+                f.write("[")
+                empty = True
+                for pattern_data in self._iter_pattern_dicts():
+                    if compact:
+                        if not empty:
+                            f.write(",")
+                        f.write(
+                            json.dumps(
+                                pattern_data, separators=(",", ":"), ensure_ascii=False
+                            )
+                        )
+                    else:
+                        f.write("\n" if empty else ",\n")
+                        text = json.dumps(pattern_data, indent=4, ensure_ascii=False)
+                        f.write(textwrap.indent(text, "    "))
+                    empty = False
+                f.write("]" if empty or compact else "\n]")
+            os.replace(tmp_path, filepath)
             log.info(f"Patterns exported to {filepath}")
             return True
         except Exception as e:
             log.error(f"Error exporting patterns: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return False
 
     # Import patterns from JSON
     def import_patterns(self, filepath):
+        global _suppress_modified_updates
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_pattern_file(filepath)
+
+            # プロパティを設定するたびに更新コールバックが走らないようにする
+            _suppress_modified_updates = True
 
             # Clear existing patterns before import
             self.patterns.clear()
@@ -442,49 +665,22 @@ class ModularRenamerPreferences(AddonPreferences):
                         elem_disp_name,
                     )
 
-                    element.enabled = element_config.get("enabled", True)
-                    element.order = element_config.get(
-                        "order", len(pattern.elements) - 1
-                    )
-                    element.separator = element_config.get("separator", "_")
+                    # 全タイプ共通のプロパティと既定値
+                    common_defaults = {
+                        "enabled": True,
+                        "order": len(pattern.elements) - 1,
+                        "separator": "_",
+                    }
+                    for key, default in common_defaults.items():
+                        _set_if_changed(element, key, element_config.get(key, default))
 
                     # Set type-specific properties safely
-                    if element.element_type == "text" and "items" in element_config:
-                        element.items.clear()  # Clear default items if any
-                        for item_name in element_config.get("items", []):
-                            item = element.items.add()
-                            item.name = item_name
-
-                    elif (
-                        element.element_type == "numeric_counter"
-                        and "padding" in element_config
-                    ):
-                        # Make sure padding has a valid value
-                        padding_val = element_config.get("padding", 2)
-                        element.padding = max(
-                            1, min(int(padding_val), 10)
-                        )  # Clamp between 1 and 10
-
-                    # elif element.element_type == "regex" and "pattern" in element_config:
-                    #     element.pattern = element_config.get("pattern", "(.*)")
-
-                    # elif element.element_type == "date" and "date_format" in element_config:
-                    #     element.date_format = element_config.get("date_format", "%Y%m%d")
-
-                    # elif element.element_type == "free_text" and "default_text" in element_config:
-                    #     element.default_text = element_config.get("default_text", "")
-
-                    elif element.element_type == "position":
-                        element.xaxis_type = element_config.get("xaxis_type", "L|R")
-                        element.xaxis_enabled = element_config.get(
-                            "xaxis_enabled", True
-                        )
-                        element.yaxis_enabled = element_config.get(
-                            "yaxis_enabled", False
-                        )
-                        element.zaxis_enabled = element_config.get(
-                            "zaxis_enabled", False
-                        )
+                    import_apply = _IMPORT_APPLY.get(element.element_type)
+                    if import_apply:
+                        import_apply(element, element_config)
+
+                # ファイルの要素の並びが順序値と一致するとは限らないため、ここで揃えておく
+                pattern.sort_elements_by_order()
 
             log.info(f"Patterns imported from {filepath}")
             return True
@@ -499,6 +695,8 @@ class ModularRenamerPreferences(AddonPreferences):
             log.error(f"Error importing patterns: {e}")
             # インポート失敗時も部分的に読み込まれたパターンは残る可能性がある
             return False
+        finally:
+            _suppress_modified_updates = False
 
     def create_default_patterns(self):
         # デフォルトパターンが既に存在するかチェック（ID基準が望ましい）
@@ -509,72 +707,71 @@ class ModularRenamerPreferences(AddonPreferences):
             )
             return False  # 作成しなかったことを示す
 
+        global _suppress_modified_updates
         log.info("Creating default patterns...")
+        # 作成中にプロパティを設定するたびに更新コールバックが走らないようにする
+        _suppress_modified_updates = True
         try:
             # Create a default pattern for pose bones
             bone_pattern = self.add_pattern("pose_bone_default", "Default Bone Pattern")
 
             # Add prefix element
             prefix = bone_pattern.add_element("prefix", "text", "Prefix")
-            prefix.items.clear()
-            for name in ["CTRL", "DEF", "MCH", "ORG", "DRV", "TRG", "PROP"]:
-                item = prefix.items.add()
-                item.name = name
+            _set_item_names(prefix, ["CTRL", "DEF", "MCH", "ORG", "DRV", "TRG", "PROP"])
 
             # Add middle element
             middle = bone_pattern.add_element("middle", "text", "Middle")
-            middle.items.clear()
-            for name in [
-                "Bone",
-                "Root",
-                "Spine",
-                "Chest",
-                "Torso",
-                "Hips",
-                "Tail",
-                "Neck",
-                "Head",
-                "Shoulder",
-                "Arm",
-                "Elbow",
-                "ForeArm",
-                "Hand",
-                "InHand",
-                "Finger",
-                "UpLeg",
-                "Leg",
-                "Shin",
-                "Foot",
-                "Knee",
-                "Toe",
-            ]:
-                item = middle.items.add()
-                item.name = name
+            _set_item_names(
+                middle,
+                [
+                    "Bone",
+                    "Root",
+                    "Spine",
+                    "Chest",
+                    "Torso",
+                    "Hips",
+                    "Tail",
+                    "Neck",
+                    "Head",
+                    "Shoulder",
+                    "Arm",
+                    "Elbow",
+                    "ForeArm",
+                    "Hand",
+                    "InHand",
+                    "Finger",
+                    "UpLeg",
+                    "Leg",
+                    "Shin",
+                    "Foot",
+                    "Knee",
+                    "Toe",
+                ],
+            )
 
             # Add finger element
             finger = bone_pattern.add_element("finger", "text", "Finger")
-            finger.items.clear()
-            for name in ["Finger", "Thumb", "Index", "Middle", "Ring", "Pinky"]:
-                item = finger.items.add()
-                item.name = name
+            _set_item_names(
+                finger, ["Finger", "Thumb", "Index", "Middle", "Ring", "Pinky"]
+            )
 
             # Add suffix element
             suffix = bone_pattern.add_element("suffix", "text", "Suffix")
-            suffix.items.clear()
-            for name in [
-                "Base",
-                "Tweak",
-                "Pole",
-                "IK",
-                "FK",
-                "Roll",
-                "Rot",
-                "Loc",
-                "Scale",
-                "INT",
-            ]:
-                item = suffix.items.add()
-                item.name = name
+            _set_item_names(
+                suffix,
+                [
+                    "Base",
+                    "Tweak",
+                    "Pole",
+                    "IK",
+                    "FK",
+                    "Roll",
+                    "Rot",
+                    "Loc",
+                    "Scale",
+                    "INT",
+                ],
+            )
 
             # Add counter element
             counter = bone_pattern.add_element("counter", "numeric_counter", "Counter")
@@ -587,9 +784,6 @@ class ModularRenamerPreferences(AddonPreferences):
             position.xaxis_type = "L|R"
             position.xaxis_enabled = True
             position.yaxis_enabled = False
-            position.yaxis_enabled = False
-            # Z軸の設定（デフォルトで無効だが、設定可能にする）
-            position.yaxis_enabled = False
             # Z軸の設定（デフォルトで無効だが、設定可能にする）
             position.zaxis_enabled = False
 
@@ -600,6 +794,8 @@ class ModularRenamerPreferences(AddonPreferences):
             # 作成中にエラーが発生した場合、部分的に作成されたパターンが残る可能性がある
             # 必要であれば、ここでロールバック処理を追加する
             return False  # 作成失敗
+        finally:
+            _suppress_modified_updates = False
 
     def draw(self, context):
         layout = self.layout
@@ -1,7 +1,6 @@
 from typing import Any, Optional, Set, Type, Union
 
-import bpy
-from bpy.types import Context
+from bpy.types import Armature, Bone, Context, EditBone, Object, PoseBone
 
 from ..core.blender.outliner_access import OutlinerElementInfo
 from ..core.blender.outliner_struct import BlenderIDTypes as BID
@@ -18,11 +17,13 @@ log = get_logger(__name__)
 class ObjectRenameTarget(BaseRenameTarget):
     """オブジェクトのリネームターゲット"""
 
+    __slots__ = ()
+
     bl_type = "OBJECT"
     ol_type = OT.TSE_SOME_ID
     ol_idcode = BID.ID_OB
     namespace_key = "objects"
-    collection_type = bpy.types.Object
+    collection_type = Object
 
     display_name = "Object"
     icon = "OBJECT_DATA"
@@ -30,13 +31,14 @@ class ObjectRenameTarget(BaseRenameTarget):
     def create_namespace(self) -> Set[str]:
         data = self._context.blend_data
         if data:
-            return {obj.name for obj in data.objects}
+            # keys() はC側で名前の一覧を作るため、要素ごとの属性アクセスより速い
+            return set(data.objects.keys())
         return set()
 
     @classmethod
     def can_create_from_scope(cls, source_item: Any, scope: OperationScope) -> bool:
         if scope.mode == CollectionSource.VIEW3D:
-            return isinstance(source_item, bpy.types.Object)
+            return isinstance(source_item, Object)
 
         elif scope.mode == CollectionSource.OUTLINER:
             if isinstance(source_item, OutlinerElementInfo):
@@ -59,7 +61,7 @@ class ObjectRenameTarget(BaseRenameTarget):
         # if not cls.can_create_from_scope(source_item, scope):
         #     return None
 
-        target_object: Optional[bpy.types.Object] = None
+        target_object: Optional[Object] = None
 
         if scope.mode == CollectionSource.VIEW3D:
             target_object = source_item
@@ -72,7 +74,7 @@ class ObjectRenameTarget(BaseRenameTarget):
                 and source_item.type == OT.TSE_SOME_ID
             ):
                 target_object = pointer_cache.get_object_by_pointer(
-                    source_item.id, bpy.types.Object
+                    source_item.id, Object
                 )
 
         if target_object:
@@ -84,6 +86,8 @@ class ObjectRenameTarget(BaseRenameTarget):
 class BoneTargetMixin:
     """ボーンのリネームターゲットのミックスイン"""
 
+    __slots__ = ()
+
     # NOTE: 親要素IDはtree_element.parent.contents.id
     ol_idcode = None
     # NOTE: BaseRenameTarget と BoneTargetMixin の両方で display_name が定義されており、BaseRenameTarget の定義が優先された
@@ -91,6 +95,9 @@ class BoneTargetMixin:
     # display_name = "Bone"
     # icon = "BONE_DATA"
 
+    # 名前空間を構成するアーマチュアのコレクション名
+    bone_collection_attr = "bones"
+
     def get_namespace_key(self) -> str:
         return self.namespace_key.format(armature_data_name=self._armature_data.name)
 
@@ -100,13 +107,18 @@ class BoneTargetMixin:
         """ボーン名前空間を作成"""
         arm = self._armature_data
         if arm:
-            return {bone.name for bone in arm.bones}
+            # コレクションは名前空間の作成時に一度だけ解決する
+            bones = getattr(arm, self.bone_collection_attr, None)
+            if bones is not None:
+                return set(bones.keys())
         return set()
 
 
 class BoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
     """ボーンのリネームターゲット"""
 
+    __slots__ = ("_armature_data",)
+
     bl_type = "BONE"
     ol_type = OT.TSE_BONE
     display_name = "Bone"
@@ -114,12 +126,12 @@ class BoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
 
     namespace_key = "bones_{armature_data_name}"
 
-    def __init__(self, data: bpy.types.Bone, context=None):
+    def __init__(self, data: Bone, context=None):
         super().__init__(data, context)
 
-        self._armature_data: Optional[bpy.types.Armature] = None
+        self._armature_data: Optional[Armature] = None
 
-        if isinstance(data, bpy.types.Bone):
+        if isinstance(data, Bone):
             self._armature_data = data.id_data
         else:
             raise ValueError(f"Invalid bone data type: {type(data)}")
@@ -132,7 +144,7 @@ class BoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
 
     @classmethod
     def get_collection_type(cls) -> Type:
-        return bpy.types.Armature
+        return Armature
 
     @classmethod
     def can_create_from_scope(cls, source_item: Any, scope: OperationScope) -> bool:
@@ -156,14 +168,14 @@ class BoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
     def create_from_scope(
         cls,
         context: Context,
-        source_item: Union[bpy.types.Bone, OutlinerElementInfo],
+        source_item: Union[Bone, OutlinerElementInfo],
         scope: OperationScope,
         pointer_cache: PointerCache,
     ) -> Optional["IRenameTarget"]:
         # if not cls.can_create_from_scope(source_item, scope):
         #     return None
 
-        target_bone: Optional[bpy.types.Bone] = None
+        target_bone: Optional[Bone] = None
 
         if scope.mode == CollectionSource.VIEW3D:
             log.warning(
@@ -176,9 +188,7 @@ class BoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
                 isinstance(source_item, OutlinerElementInfo)
                 and source_item.type == OT.TSE_BONE
             ):
-                arm_data = pointer_cache.get_object_by_pointer(
-                    source_item.id, bpy.types.Armature
-                )
+                arm_data = pointer_cache.get_object_by_pointer(source_item.id, Armature)
                 if arm_data:
                     bone_name = source_item.name
                     found_bone = arm_data.bones.get(bone_name)
@@ -201,6 +211,8 @@ class BoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
 class PoseBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
     """ポーズボーンのリネームターゲット"""
 
+    __slots__ = ("_armature_data",)
+
     bl_type = "POSE_BONE"
     ol_type = OT.TSE_POSE_CHANNEL
     display_name = "Pose Bone"
@@ -208,15 +220,15 @@ class PoseBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
 
     namespace_key = "pose_bones_{armature_data_name}"
 
-    def __init__(self, data: bpy.types.PoseBone, context=None):
+    def __init__(self, data: PoseBone, context=None):
         super().__init__(data, context)
 
         # Namespaces用なので、ObjectではなくArmatureを保持する
-        self._armature_data: Optional[bpy.types.Armature] = None
+        self._armature_data: Optional[Armature] = None
 
         # bpy.types.Boneも必要?
         # C.selected_pose_bonesはPoseBoneを返す。C.selected_bonesはBoneを返す。
-        if isinstance(data, bpy.types.PoseBone):
+        if isinstance(data, PoseBone):
             self._armature_data = data.id_data.data
         else:
             raise ValueError(f"Invalid pose bone data type: {type(data)}")
@@ -230,13 +242,13 @@ class PoseBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
     @classmethod
     def get_collection_type(cls) -> Type:
         """PointerCache用"""
-        return bpy.types.Object
+        return Object
 
     @classmethod
     def can_create_from_scope(cls, source_item: Any, scope: OperationScope) -> bool:
         """このポーズボーンがターゲットを作成できるか判定"""
         if scope.mode == CollectionSource.VIEW3D:
-            return isinstance(source_item, bpy.types.PoseBone)
+            return isinstance(source_item, PoseBone)
         elif scope.mode == CollectionSource.OUTLINER:
             return (
                 isinstance(source_item, OutlinerElementInfo)
@@ -248,7 +260,7 @@ class PoseBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
     def create_from_scope(
         cls,
         context: Context,
-        source_item: Union[bpy.types.PoseBone, OutlinerElementInfo],
+        source_item: Union[PoseBone, OutlinerElementInfo],
         scope: OperationScope,
         pointer_cache: PointerCache,
     ) -> Optional["IRenameTarget"]:
@@ -256,7 +268,7 @@ class PoseBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
         # if not cls.can_create_from_scope(source_item, scope):
         #     return None
 
-        target_object: Optional[bpy.types.PoseBone] = None
+        target_object: Optional[PoseBone] = None
 
         if scope.mode == CollectionSource.VIEW3D:
             target_object = source_item
@@ -269,9 +281,7 @@ class PoseBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
                 isinstance(source_item, OutlinerElementInfo)
                 and source_item.type == OT.TSE_POSE_CHANNEL
             ):
-                arm_obj = pointer_cache.get_object_by_pointer(
-                    source_item.id, bpy.types.Object
-                )
+                arm_obj = pointer_cache.get_object_by_pointer(source_item.id, Object)
                 if arm_obj and arm_obj.type == "ARMATURE":
                     bone_name = source_item.name
                     found_pose_bone = arm_obj.pose.bones.get(bone_name)
@@ -294,19 +304,23 @@ class PoseBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
 class EditBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
     """エディットボーンのリネームターゲット"""
 
+    __slots__ = ("_armature_data",)
+
     bl_type = "EDIT_BONE"
     ol_type = OT.TSE_EBONE
     display_name = "Edit Bone"
     icon = "BONE_DATA"
 
     namespace_key = "edit_bones_{armature_data_name}"
+    # エディットモード中に追加・リネームされたボーンは bones に反映されていない
+    bone_collection_attr = "edit_bones"
 
-    def __init__(self, data: bpy.types.EditBone, context=None):
+    def __init__(self, data: EditBone, context=None):
         super().__init__(data, context)
 
-        self._armature_data: Optional[bpy.types.Armature] = None
+        self._armature_data: Optional[Armature] = None
 
-        if isinstance(data, bpy.types.EditBone):
+        if isinstance(data, EditBone):
             self._armature_data = data.id_data
         else:
             raise ValueError(f"Invalid edit bone data type: {type(data)}")
@@ -319,13 +333,13 @@ class EditBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
 
     @classmethod
     def get_collection_type(cls) -> Type:
-        return bpy.types.Armature
+        return Armature
 
     @classmethod
     def can_create_from_scope(cls, source_item: Any, scope: OperationScope) -> bool:
         """このエディットボーンがターゲットを作成できるか判定"""
         if scope.mode == CollectionSource.VIEW3D:
-            return isinstance(source_item, bpy.types.EditBone)
+            return isinstance(source_item, EditBone)
         elif scope.mode == CollectionSource.OUTLINER:
             return (
                 isinstance(source_item, OutlinerElementInfo)
@@ -337,7 +351,7 @@ class EditBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
     def create_from_scope(
         cls,
         context: Context,
-        source_item: Union[bpy.types.EditBone, OutlinerElementInfo],
+        source_item: Union[EditBone, OutlinerElementInfo],
         scope: OperationScope,
         pointer_cache: PointerCache,
     ) -> Optional["IRenameTarget"]:
@@ -345,7 +359,7 @@ class EditBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
         if not cls.can_create_from_scope(source_item, scope):
             return None
 
-        target_object: Optional[bpy.types.EditBone] = None
+        target_object: Optional[EditBone] = None
 
         if scope.mode == CollectionSource.VIEW3D:
             target_object = source_item
@@ -356,9 +370,7 @@ class EditBoneRenameTarget(BaseRenameTarget, BoneTargetMixin):
                 isinstance(source_item, OutlinerElementInfo)
                 and source_item.type == OT.TSE_EBONE
             ):
-                arm_data = pointer_cache.get_object_by_pointer(
-                    source_item.id, bpy.types.Armature
-                )
+                arm_data = pointer_cache.get_object_by_pointer(source_item.id, Armature)
                 if arm_data:
                     bone_name = source_item.name
                     found_edit_bone = arm_data.edit_bones.get(bone_name)
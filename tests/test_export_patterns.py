@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+pytest.importorskip("bpy")
+
+from ..preferences import ModularRenamerPreferences
+
+
+class _FakePreferences:
+    """export_patterns が使う _iter_pattern_dicts だけを持つ設定"""
+
+    def __init__(self, patterns, fail_after=None):
+        self._patterns = patterns
+        self._fail_after = fail_after
+
+    def _iter_pattern_dicts(self):
+        for i, pattern_data in enumerate(self._patterns):
+            if i == self._fail_after:
+                raise RuntimeError("element export failed")
+            yield pattern_data
+
+
+PATTERNS = [
+    {"id": "a", "name": "A", "elements": [{"id": "prefix", "order": 0}]},
+    {"id": "b", "name": "B", "elements": []},
+]
+
+
+def test_export_writes_indented_json(tmp_path):
+    filepath = str(tmp_path / "patterns.json")
+
+    assert ModularRenamerPreferences.export_patterns(
+        _FakePreferences(PATTERNS), filepath
+    )
+
+    with open(filepath, encoding="utf-8") as f:
+        assert f.read() == json.dumps(PATTERNS, indent=4)
+    assert [p.name for p in tmp_path.iterdir()] == ["patterns.json"]
+
+
+def test_export_failure_keeps_existing_file(tmp_path):
+    filepath = tmp_path / "patterns.json"
+    filepath.write_text("existing", encoding="utf-8")
+
+    assert not ModularRenamerPreferences.export_patterns(
+        _FakePreferences(PATTERNS, fail_after=1), str(filepath)
+    )
+
+    # 書き出しに失敗しても既存のファイルは変わらず、一時ファイルも残らない
+    assert filepath.read_text(encoding="utf-8") == "existing"
+    assert [p.name for p in tmp_path.iterdir()] == ["patterns.json"]
+
+
+def test_export_compact_writes_json_without_whitespace(tmp_path):
+    filepath = str(tmp_path / "patterns.json")
+
+    assert ModularRenamerPreferences.export_patterns(
+        _FakePreferences(PATTERNS), filepath, compact=True
+    )
+
+    with open(filepath, encoding="utf-8") as f:
+        assert f.read() == json.dumps(PATTERNS, separators=(",", ":"))
@@ -11,6 +11,7 @@ from bpy.props import (
     StringProperty,
 )
 from bpy.types import Context
+from bpy_extras.io_utils import ExportHelper
 
 from ..addon import prefs
 from ..core.constants import ELEMENT_TYPE_ITEMS, POSITION_ENUM_ITEMS
@@ -239,6 +240,7 @@ class MODRENAMER_PT_MainPanel(bpy.types.Panel):
 
         row = layout.row()
         row.operator("wm.save_userpref", text="Save User Prefs")
+        row.operator("modrenamer.export_patterns", icon="EXPORT", text="")
 
         row = layout.row()
         row.label(text="Pattern:")
@@ -350,7 +352,8 @@ class MODRENAMER_PT_MainPanel(bpy.types.Panel):
 
             # Separator (disabled for first element)
             row = ele_box.row()
-            row.enabled = element.order > 0
+            # 順序値は削除・移動で更新されないため、コレクション内の位置で判定する
+            row.enabled = pattern.active_element_index > 0
             row.prop(element, "separator", text="Separator", translate=False)
 
             # Element-specific properties
@@ -465,7 +468,8 @@ class MODRENAMER_PT_MainPanel(bpy.types.Panel):
 
     def draw_pattern_elements(self, layout, pattern):
         """Draw the elements of a pattern for renaming (non-edit mode)"""
-        for element in sorted(pattern.elements, key=lambda e: e.order):
+        # 要素の順序はコレクション内の位置で決まるため、描画のたびにソートしない
+        for element in pattern.elements:
             if not element.enabled:
                 continue
 
@@ -991,3 +995,26 @@ class MODRENAMER_OT_CreateDefaultPatterns(bpy.types.Operator):
         pr.create_default_patterns()
         self.report({"INFO"}, "Default patterns created")
         return {"FINISHED"}
+
+
+class MODRENAMER_OT_ExportPatterns(bpy.types.Operator, ExportHelper):
+    """Export all naming patterns to a JSON file"""
+
+    bl_idname = "modrenamer.export_patterns"
+    bl_label = "Export Patterns"
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={"HIDDEN"})
+
+    compact: BoolProperty(
+        name="Compact",
+        description="改行やインデントを省いて書き出す (手で編集しないファイル向け)",
+        default=False,
+    )
+
+    def execute(self, context):
+        if not prefs().export_patterns(self.filepath, compact=self.compact):
+            self.report({"ERROR"}, "Failed to export patterns")
+            return {"CANCELLED"}
+        self.report({"INFO"}, f"Patterns exported to {self.filepath}")
+        return {"FINISHED"}
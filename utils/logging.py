@@ -178,6 +178,10 @@ class AddonLogger:
 
         self.memory_handler.capacity = config.memory_capacity
 
+    def is_enabled_for(self, level):
+        """指定レベルのログが記録されるか（メッセージの組み立てを省くために使う）"""
+        return self.logger.isEnabledFor(level)
+
     def debug(self, message):
         """デバッグレベルのログを記録"""
         self.logger.debug(message)
@@ -1,9 +1,69 @@
 import functools
 import re
+from typing import Dict, Tuple
 
 from ..core.constants import SEPARATOR_ITEMS
 
 
+@functools.lru_cache(maxsize=256)
+def build_alternation(items: Tuple[str, ...]) -> str:
+    """
+    文字列のリストから選択肢の正規表現パターンを構築する
+
+    パターンは設定変更のたびに同じ項目で再構築されるため、結果をキャッシュする
+    """
+    return trie_alternation(items)
+
+
+_TRIE_END = ""  # 項目の終端を表すキー（1文字のキーとは衝突しない）
+
+
+def trie_alternation(items: Tuple[str, ...]) -> str:
+    """
+    共通の接頭辞をまとめた選択肢の正規表現パターンを構築する
+
+    例: ("L", "Left", "Top", "Bot") -> "(?:L(?:eft)?|Top|Bot)"
+
+    同じ位置の分岐は先頭文字が異なるため順序に依存せず、
+    項目の途中で終わる場合は貪欲な省略可能グループにして長い項目を優先する
+    """
+    trie: Dict[str, dict] = {}
+    for item in items:
+        node = trie
+        for char in item:
+            node = node.setdefault(char, {})
+        node[_TRIE_END] = {}
+    return _render_trie(trie)
+
+
+def _render_trie(node: Dict[str, dict]) -> str:
+    """trie_alternation のトライを正規表現に変換する"""
+    alternatives = []
+    leaf_chars = []
+    for char, child in node.items():
+        if char == _TRIE_END:
+            continue
+        if child.keys() == {_TRIE_END}:
+            # 1文字で終わる分岐は文字クラスにまとめる
+            leaf_chars.append(re.escape(char))
+        else:
+            alternatives.append(re.escape(char) + _render_trie(child))
+
+    if len(leaf_chars) == 1:
+        alternatives.append(leaf_chars[0])
+    elif leaf_chars:
+        alternatives.append(f"[{''.join(leaf_chars)}]")
+
+    if not alternatives:
+        return ""
+
+    optional = _TRIE_END in node
+    if len(alternatives) == 1 and not optional:
+        return alternatives[0]
+    group = f"(?:{'|'.join(alternatives)})"
+    return f"{group}?" if optional else group
+
+
 def add_named_capture_group(func):
     """
     関数の戻り値を名前付きキャプチャグループで囲むデコレーター
@@ -17,6 +77,10 @@ def add_named_capture_group(func):
     return wrapper
 
 
+# 先頭要素の後ろに続く可能性のある全セパレーター
+_ANY_SEPARATOR = "|".join(re.escape(item[0]) for item in SEPARATOR_ITEMS)
+
+
 def add_separator_by_order(func):
     """
     要素の順序に基づいてセパレーターを追加するデコレーター
@@ -24,15 +88,13 @@ def add_separator_by_order(func):
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        sep = f"(?:{re.escape(self.separator)})?"
         order = self.order
         result = func(self, *args, **kwargs)
         if result:
             if order != 0:
-                return f"{sep}{result}"
+                return f"(?:{self.escaped_separator})?{result}"
             else:
-                seps = "|".join(re.escape(item[0]) for item in SEPARATOR_ITEMS)
-                return f"{result}(?:{seps})?"
+                return f"{result}(?:{_ANY_SEPARATOR})?"
         else:
             return result
 
@@ -1,5 +1,8 @@
 import re
 
+# 先頭以外の大文字の直前 (区切り位置)
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
 
 def to_snake_case(name: str) -> str:
     """
@@ -11,7 +14,7 @@ def to_snake_case(name: str) -> str:
         >>> to_snake_case("blenderCounter")     # "blender_counter"
         >>> to_snake_case("Blender_Counter")    # "blender_counter"
     """
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+    return _CAMEL_BOUNDARY_RE.sub("_", name).lower()
 
 
 def is_pascal_case(name: str) -> bool: